@@ -11,7 +11,7 @@ Scale Seed（大量假資料匯入，偏 UI 完整性驗證用）
 
 因此這支腳本的定位是：
 - 以「一個 org、量級大、全繁體中文」為目標，生成可重現的大數據 demo
-- 用 Postgres 的 COPY（psql \\copy）高速匯入
+- 用 Postgres 的 COPY（COPY ... FROM STDIN，經 psql stdin 串流）高速匯入
 - 預設不依賴外部模型（rules provider），但保留 text provider 介面（未來可接 Hugging Face）
 
 執行方式（Docker 建議）
@@ -47,6 +47,10 @@ Scale Seed（大量假資料匯入，偏 UI 完整性驗證用）
   SCALE_SCANS_PER_SESSION   預設 300
   SCALE_AUDIT_EVENTS        預設 5000
 
+除錯/檢查（選填）：
+  SCALE_WORKDIR             預設空（資料直接串流給 psql，不落地）；
+                            設定後會先把完整 load script 寫成 <workdir>/load.sql 再匯入
+
 安全性提醒（很重要）
 -------------------
 - 這是 demo/測試資料：會建立可登入的帳號（統一密碼），請勿指向正式環境。
@@ -55,19 +59,25 @@ Scale Seed（大量假資料匯入，偏 UI 完整性驗證用）
 
 from __future__ import annotations
 
+import array
 import base64
 import csv
 import dataclasses
 import datetime as dt
+import functools
+import itertools
 import hashlib
 import json
 import os
 import random
 import re
+import shutil
+import string
 import subprocess
 import sys
 import uuid
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping, Sequence, TextIO
 
 
 # ----------------------------
@@ -75,13 +85,18 @@ from pathlib import Path
 # ----------------------------
 
 
-def env_str(name: str, default: str) -> str:
-    v = os.environ.get(name)
+# env 由呼叫端傳入（load_config 先對 os.environ 做一次 snapshot）：
+# - 整份設定都從同一份快照讀出，不會因執行中 env 被改動而前後不一致
+# - 也方便直接丟一個 dict 進來檢查設定解析（不必動真的 process env）
+
+
+def env_str(env: Mapping[str, str], name: str, default: str) -> str:
+    v = env.get(name)
     return default if v is None else str(v).strip()
 
 
-def env_int(name: str, default: int) -> int:
-    v = os.environ.get(name)
+def env_int(env: Mapping[str, str], name: str, default: int) -> int:
+    v = env.get(name)
     if v is None or str(v).strip() == "":
         return default
     try:
@@ -90,8 +105,8 @@ def env_int(name: str, default: int) -> int:
         raise SystemExit(f"[seed-scale] env {name} must be int, got: {v!r}")
 
 
-def env_choice(name: str, default: str, allowed: list[str]) -> str:
-    v = env_str(name, default)
+def env_choice(env: Mapping[str, str], name: str, default: str, allowed: list[str]) -> str:
+    v = env_str(env, name, default)
     if v not in allowed:
         raise SystemExit(f"[seed-scale] env {name} must be one of {allowed}, got: {v!r}")
     return v
@@ -106,6 +121,11 @@ def must_positive(name: str, value: int) -> int:
 # org_code 會被用在 SQL（DELETE WHERE code=...），因此限制格式避免奇怪字元。
 ORG_CODE_RE = re.compile(r"^[a-z0-9][a-z0-9-]{1,62}$")
 
+# load script 的寫出緩衝（1 MiB）：COPY 資料列是一大串小 write，用大緩衝把 syscall 次數壓到最低
+# - 用於 psql 的 stdin pipe，以及檢查模式的 load.sql
+# - 不逐列 flush（只在每段 script 寫完/關檔時才送出）
+COPY_WRITE_BUFFER_SIZE = 1 << 20
+
 
 @dataclasses.dataclass(frozen=True)
 class ScaleConfig:
@@ -135,43 +155,48 @@ class ScaleConfig:
     scans_per_session: int
     audit_events: int
 
-    # Script workdir（容器內寫檔；不污染 repo）
-    workdir: Path
+    # 檢查用 workdir（選填）：
+    # - 預設 None：load script 直接經 stdin 串流給 psql，不落地
+    # - 有設定：把完整 load script 寫成 <workdir>/load.sql 再匯入（方便人工打開檢查資料）
+    workdir: Path | None
+
 
+def load_config(env: Mapping[str, str] | None = None) -> ScaleConfig:
+    env = dict(os.environ) if env is None else env
 
-def load_config() -> ScaleConfig:
-    org_code = env_str("SCALE_ORG_CODE", "demo-lms-scale")
+    org_code = env_str(env, "SCALE_ORG_CODE", "demo-lms-scale")
     if not ORG_CODE_RE.match(org_code):
         raise SystemExit(
             "[seed-scale] SCALE_ORG_CODE format invalid; use only lowercase letters/digits/dash, "
             f"2..63 chars, got: {org_code!r}"
         )
 
-    org_name = env_str("SCALE_ORG_NAME", "示範國小（大型資料集）")
-    seed = env_int("SCALE_SEED", 42)
-    text_provider = env_choice("SCALE_TEXT_PROVIDER", "rules", ["rules", "hf"])
-    password = env_str("SCALE_PASSWORD", "demo1234")
+    org_name = env_str(env, "SCALE_ORG_NAME", "示範國小（大型資料集）")
+    seed = env_int(env, "SCALE_SEED", 42)
+    text_provider = env_choice(env, "SCALE_TEXT_PROVIDER", "rules", ["rules", "hf"])
+    password = env_str(env, "SCALE_PASSWORD", "demo1234")
 
-    students = must_positive("SCALE_STUDENTS", env_int("SCALE_STUDENTS", 5000))
-    teachers = must_positive("SCALE_TEACHERS", env_int("SCALE_TEACHERS", 200))
-    bibs = must_positive("SCALE_BIBS", env_int("SCALE_BIBS", 4000))
-    max_copies_per_bib = env_int("SCALE_MAX_COPIES_PER_BIB", 3)
+    students = must_positive("SCALE_STUDENTS", env_int(env, "SCALE_STUDENTS", 5000))
+    teachers = must_positive("SCALE_TEACHERS", env_int(env, "SCALE_TEACHERS", 200))
+    bibs = must_positive("SCALE_BIBS", env_int(env, "SCALE_BIBS", 4000))
+    max_copies_per_bib = env_int(env, "SCALE_MAX_COPIES_PER_BIB", 3)
     if max_copies_per_bib < 1 or max_copies_per_bib > 10:
         raise SystemExit("[seed-scale] SCALE_MAX_COPIES_PER_BIB must be 1..10")
 
-    open_loans = must_positive("SCALE_OPEN_LOANS", env_int("SCALE_OPEN_LOANS", 1500))
-    closed_loans = must_positive("SCALE_CLOSED_LOANS", env_int("SCALE_CLOSED_LOANS", 12000))
-    ready_holds = must_positive("SCALE_READY_HOLDS", env_int("SCALE_READY_HOLDS", 300))
-    queued_holds = must_positive("SCALE_QUEUED_HOLDS", env_int("SCALE_QUEUED_HOLDS", 800))
+    open_loans = must_positive("SCALE_OPEN_LOANS", env_int(env, "SCALE_OPEN_LOANS", 1500))
+    closed_loans = must_positive("SCALE_CLOSED_LOANS", env_int(env, "SCALE_CLOSED_LOANS", 12000))
+    ready_holds = must_positive("SCALE_READY_HOLDS", env_int(env, "SCALE_READY_HOLDS", 300))
+    queued_holds = must_positive("SCALE_QUEUED_HOLDS", env_int(env, "SCALE_QUEUED_HOLDS", 800))
     inventory_sessions = must_positive(
-        "SCALE_INVENTORY_SESSIONS", env_int("SCALE_INVENTORY_SESSIONS", 2)
+        "SCALE_INVENTORY_SESSIONS", env_int(env, "SCALE_INVENTORY_SESSIONS", 2)
     )
     scans_per_session = must_positive(
-        "SCALE_SCANS_PER_SESSION", env_int("SCALE_SCANS_PER_SESSION", 300)
+        "SCALE_SCANS_PER_SESSION", env_int(env, "SCALE_SCANS_PER_SESSION", 300)
     )
-    audit_events = must_positive("SCALE_AUDIT_EVENTS", env_int("SCALE_AUDIT_EVENTS", 5000))
+    audit_events = must_positive("SCALE_AUDIT_EVENTS", env_int(env, "SCALE_AUDIT_EVENTS", 5000))
 
-    workdir = Path(env_str("SCALE_WORKDIR", "/tmp/seed-scale")).resolve()
+    workdir_raw = env_str(env, "SCALE_WORKDIR", "")
+    workdir = Path(workdir_raw).resolve() if workdir_raw else None
 
     return ScaleConfig(
         org_code=org_code,
@@ -209,21 +234,25 @@ class TextProvider:
     - 若你後續真的要「更自然的書名/主題詞」，再把 hf provider 接上（且仍可重現）
     """
 
-    def person_name(self) -> str:  # noqa: D401
-        """產生繁中姓名（可重複；不含真實個資）。"""
+    def person_name_batch(self, n: int) -> list[str]:
+        """一次產生 n 個繁中姓名（可重複；不含真實個資；整批抽，避免每個姓名都走好幾次 rng 呼叫）。"""
 
         raise NotImplementedError
 
-    def publisher(self) -> str:
+    def publisher_batch(self, n: int) -> list[str]:
         raise NotImplementedError
 
-    def subject_terms(self, k: int) -> list[str]:
+    def subject_terms_batch(self, ks: Sequence[int]) -> list[list[str]]:
+        """一次替多筆書目抽主題詞：第 i 組恰好 ks[i] 個不重複詞（ks[i] 會被夾在 1..詞彙數之間）。"""
+
         raise NotImplementedError
 
-    def bib_title(self) -> str:
+    def bib_title_batch(self, n: int) -> list[str]:
+        """一次產生 n 個書名（給 bibs 的整批生成；同 person_name_batch）。"""
+
         raise NotImplementedError
 
-    def classification(self) -> str:
+    def classification_batch(self, n: int) -> list[str]:
         raise NotImplementedError
 
     def geographic_terms(self, k: int) -> list[str]:
@@ -248,12 +277,179 @@ class TextProvider:
 
         raise NotImplementedError
 
-    def language_code(self) -> str:
-        """產生語言代碼（MARC 041$a；目前先寬鬆，不嚴格限制 ISO 639）。"""
+    def language_code_batch(self, n: int) -> list[str]:
+        """一次產生 n 個語言代碼（MARC 041$a；目前先寬鬆，不嚴格限制 ISO 639）。"""
 
         raise NotImplementedError
 
 
+# RulesTextProvider 的「隨機抽樣字庫」（module-level 常數）
+#
+# - 每個 bib/user 都會抽好幾次 → 方法內直接讀 module global，不必每次經過 self → class 的屬性查找
+# - 一律用 tuple（不可變）：字庫被所有 instance 共用，避免某處不小心 append/shuffle 污染字庫（影響可重現性）
+# - rng.choice/choices/sample 對 tuple 與 list 行為完全相同（抽樣結果不變）
+#
+# 其餘 authority 詞彙庫（variants/edges/geographics/genres）仍放在 class 內，跟驗證邏輯放在一起。
+_SURNAMES = tuple("陳林黃張李王吳劉蔡楊許鄭謝郭洪曾邱廖賴周葉蘇盧鍾徐彭呂江唐宋方鄒何高潘")
+_GIVEN_CHARS = tuple("家怡冠承宇宸柏彥子恩佳庭妤瑄婕睿哲昕庭妍筱涵昀祐瑋翔晴穎璇芷瑜婉婷思妤品妍")
+
+_PUBLISHERS = (
+    "臺灣教育出版社",
+    "五南圖書出版",
+    "三民書局",
+    "時報出版",
+    "遠流出版",
+    "親子天下",
+    "小天下",
+    "天下雜誌",
+    "康軒文教",
+    "翰林出版",
+    "聯經出版",
+    "大塊文化",
+    "國語日報",
+    "小魯文化",
+    "幼獅文化",
+    "聚珍臺灣",
+    "蓋亞文化",
+    "圓神出版",
+    "天下文化",
+)
+
+_SUBJECTS = (
+    # Library / LIS（館務/編目/治理）
+    "閱讀推廣",
+    "校園閱讀",
+    "兒童閱讀",
+    "閱讀素養",
+    "閱讀策略",
+    "閱讀理解",
+    "圖書館管理",
+    "館藏發展",
+    "選書與採購",
+    "流通管理",
+    "盤點",
+    "汰舊",
+    "編目與分類",
+    "主題分析",
+    "權威控制",
+    "書目資料",
+    "MARC 21",
+    "RDA",
+    "Dublin Core",
+    # Digital literacy（資訊/媒體）
+    "資訊素養",
+    "媒體識讀",
+    "假新聞辨識",
+    "來源評估",
+    "資訊倫理",
+    "著作權",
+    "個人資料保護",
+    "資訊安全",
+    "密碼管理",
+    "網路釣魚",
+    # Curriculum / learning（課程/學習）
+    "科普教育",
+    "科學探究",
+    "天文",
+    "物理",
+    "化學",
+    "生物",
+    "地球科學",
+    "數學思維",
+    "統計入門",
+    "語文表達",
+    "寫作技巧",
+    "英語學習",
+    "歷史入門",
+    "臺灣史",
+    "世界史",
+    "地理概念",
+    "地圖閱讀",
+    "公民教育",
+    "法律常識",
+    "藝術欣賞",
+    "音樂素養",
+    "視覺設計",
+    # CS / data（程式/資料）
+    "程式設計",
+    "演算法",
+    "Scratch",
+    "Python",
+    "AI 基礎",
+    "機器學習入門",
+    "資料分析",
+    "資料視覺化",
+    # SEL / wellbeing（身心/生活）
+    "生命教育",
+    "品格教育",
+    "情緒管理",
+    "心理成長",
+    "環境教育",
+    "永續發展",
+    "氣候變遷",
+    "資源回收",
+    "健康教育",
+    "飲食教育",
+    "運動與健康",
+    "親職教育",
+    "班級經營",
+    "多元文化教育",
+    "性別平等教育",
+    "人權教育",
+)
+
+_TITLE_TEMPLATES = (
+    "國小{subject}教學活動設計（第{edition}版）",
+    "圖書館管理實務：{subject}與應用",
+    "閱讀素養：從{subject}到{subject2}",
+    "科普小百科：{subject}",
+    "資訊安全與倫理：{subject}案例解析",
+    "{subject}入門：給老師與學生的指南",
+    "校園圖書館工作手冊：{subject}篇",
+    "學校行政與{subject}：制度、流程與工具",
+    "孩子的{subject}練習：從小學到國中",
+    "{subject}專題研究：方法與實作",
+    "用{subject}理解{subject2}：給初學者的 30 堂課",
+    "{subject} × {subject2}：跨領域素養讀本",
+    "圖書館的{subject}：案例、表單與SOP",
+    "{subject}教學備課包：評量、活動與延伸閱讀",
+)
+
+# 書名模板「預先編譯」成位置參數版本（{subject}→{0}、{subject2}→{1}、{edition}→{2}）：
+# - str.format(subject=..., ...) 每次都要建 kwargs dict 並逐一查 key；位置參數版直接按 index 取值（約快 2 倍）
+# - 模板仍以具名欄位維護（好讀），只在 import 時轉換一次；抽樣用的 index 與 _TITLE_TEMPLATES 一一對應
+_TITLE_FIELD_POSITIONS = {"subject": 0, "subject2": 1, "edition": 2}
+
+
+def _compile_title_template(tpl: str) -> str:
+    out: list[str] = []
+    for literal, field, _spec, _conv in string.Formatter().parse(tpl):
+        out.append(literal)
+        if field is not None:
+            out.append(f"{{{_TITLE_FIELD_POSITIONS[field]}}}")
+    return "".join(out)
+
+
+_TITLE_TEMPLATES_COMPILED = tuple(_compile_title_template(tpl) for tpl in _TITLE_TEMPLATES)
+
+_CLASSIFICATIONS = (
+    # 這裡不追求完整分類法，只要「看起來像真的」即可支援 UI。
+    "028.5",  # 圖書館管理
+    "020.7",  # 圖書資訊
+    "371.3",  # 教學法
+    "410",  # 數學
+    "500",  # 自然科學
+    "610",  # 醫學/健康
+    "800",  # 文學
+    "900",  # 歷史地理
+    "158.2",  # 心理/成長
+    "004",  # 電腦/資訊
+    "005.1",  # 程式設計
+    "028.7",  # 閱讀推廣/讀者服務（示意）
+    "363.7",  # 環境議題（示意）
+)
+
+
 class RulesTextProvider(TextProvider):
     """
     RulesTextProvider：不依賴外部模型的「可重現」繁中生成器。
@@ -266,113 +462,13 @@ class RulesTextProvider(TextProvider):
       3) 文字仍能覆蓋 UI 常見情境：長標題、標點、不同主題、不同分類號
     """
 
-    _SURNAMES = list("陳林黃張李王吳劉蔡楊許鄭謝郭洪曾邱廖賴周葉蘇盧鍾徐彭呂江唐宋方鄒何高潘")
-    _GIVEN_CHARS = list("家怡冠承宇宸柏彥子恩佳庭妤瑄婕睿哲昕庭妍筱涵昀祐瑋翔晴穎璇芷瑜婉婷思妤品妍")
-
-    _PUBLISHERS = [
-        "臺灣教育出版社",
-        "五南圖書出版",
-        "三民書局",
-        "時報出版",
-        "遠流出版",
-        "親子天下",
-        "小天下",
-        "天下雜誌",
-        "康軒文教",
-        "翰林出版",
-        "聯經出版",
-        "大塊文化",
-        "國語日報",
-        "小魯文化",
-        "幼獅文化",
-        "聚珍臺灣",
-        "蓋亞文化",
-        "圓神出版",
-        "天下文化",
-    ]
-
-    _SUBJECTS = [
-        # Library / LIS（館務/編目/治理）
-        "閱讀推廣",
-        "校園閱讀",
-        "兒童閱讀",
-        "閱讀素養",
-        "閱讀策略",
-        "閱讀理解",
-        "圖書館管理",
-        "館藏發展",
-        "選書與採購",
-        "流通管理",
-        "盤點",
-        "汰舊",
-        "編目與分類",
-        "主題分析",
-        "權威控制",
-        "書目資料",
-        "MARC 21",
-        "RDA",
-        "Dublin Core",
-        # Digital literacy（資訊/媒體）
-        "資訊素養",
-        "媒體識讀",
-        "假新聞辨識",
-        "來源評估",
-        "資訊倫理",
-        "著作權",
-        "個人資料保護",
-        "資訊安全",
-        "密碼管理",
-        "網路釣魚",
-        # Curriculum / learning（課程/學習）
-        "科普教育",
-        "科學探究",
-        "天文",
-        "物理",
-        "化學",
-        "生物",
-        "地球科學",
-        "數學思維",
-        "統計入門",
-        "語文表達",
-        "寫作技巧",
-        "英語學習",
-        "歷史入門",
-        "臺灣史",
-        "世界史",
-        "地理概念",
-        "地圖閱讀",
-        "公民教育",
-        "法律常識",
-        "藝術欣賞",
-        "音樂素養",
-        "視覺設計",
-        # CS / data（程式/資料）
-        "程式設計",
-        "演算法",
-        "Scratch",
-        "Python",
-        "AI 基礎",
-        "機器學習入門",
-        "資料分析",
-        "資料視覺化",
-        # SEL / wellbeing（身心/生活）
-        "生命教育",
-        "品格教育",
-        "情緒管理",
-        "心理成長",
-        "環境教育",
-        "永續發展",
-        "氣候變遷",
-        "資源回收",
-        "健康教育",
-        "飲食教育",
-        "運動與健康",
-        "親職教育",
-        "班級經營",
-        "多元文化教育",
-        "性別平等教育",
-        "人權教育",
-    ]
+    # class attribute 名稱保留給 validate_rules_vocab/main 使用（本體見上方 module-level 常數）
+    _SURNAMES = _SURNAMES
+    _GIVEN_CHARS = _GIVEN_CHARS
+    _PUBLISHERS = _PUBLISHERS
+    _SUBJECTS = _SUBJECTS
+    _TITLE_TEMPLATES = _TITLE_TEMPLATES
+    _CLASSIFICATIONS = _CLASSIFICATIONS
 
     # _SUBJECT_VARIANTS：同義詞/別名（UF）
     #
@@ -475,7 +571,7 @@ class RulesTextProvider(TextProvider):
         ("程式設計", "數學思維"),
     ]
 
-    _GEOGRAPHICS_ALL = [
+    _GEOGRAPHICS_ALL = (
         # 以臺灣常見地名為主（繁中），並補一些「階層節點」（region）讓 thesaurus/tree 有深度。
         "臺灣",
         "北部",
@@ -521,10 +617,10 @@ class RulesTextProvider(TextProvider):
         "英國",
         "法國",
         "德國",
-    ]
+    )
 
     # _GEOGRAPHICS：給書目隨機指派用（避免把「北部/中部」這類階層節點寫進 bib）
-    _GEOGRAPHICS = [
+    _GEOGRAPHICS = (
         "臺灣",
         "臺北市",
         "新北市",
@@ -563,7 +659,7 @@ class RulesTextProvider(TextProvider):
         "英國",
         "法國",
         "德國",
-    ]
+    )
 
     _GEOGRAPHIC_VARIANTS: dict[str, list[str]] = {
         "臺灣": ["台灣", "Taiwan"],
@@ -620,7 +716,7 @@ class RulesTextProvider(TextProvider):
         ("金門縣", "連江縣"),
     ]
 
-    _GENRES_ALL = [
+    _GENRES_ALL = (
         # 這裡不追求完全對齊 LCGFT，只要「足夠真實且可擴充」。
         "文學",
         "兒童讀物",
@@ -651,10 +747,10 @@ class RulesTextProvider(TextProvider):
         "期刊",
         "漫畫",
         "圖像小說",
-    ]
+    )
 
     # _GENRES：給書目隨機指派用（偏 leaf / 常見體裁）
-    _GENRES = [
+    _GENRES = (
         "圖畫書",
         "繪本",
         "童話",
@@ -680,7 +776,7 @@ class RulesTextProvider(TextProvider):
         "橋樑書",
         "故事集",
         "工具書",
-    ]
+    )
 
     _GENRE_VARIANTS: dict[str, list[str]] = {
         "推理小說": ["偵探小說", "Mystery fiction"],
@@ -729,7 +825,7 @@ class RulesTextProvider(TextProvider):
         ("漫畫", "圖畫書"),
     ]
 
-    _LANGUAGES = [
+    _LANGUAGES = (
         # 常見語言代碼（MVP 先寬鬆；用於 UI filter / MARC 041）
         "zh-TW",
         "zh",
@@ -738,102 +834,93 @@ class RulesTextProvider(TextProvider):
         "ko",
         "vi",
         "id",
-    ]
-
-    _TITLE_TEMPLATES = [
-        "國小{subject}教學活動設計（第{edition}版）",
-        "圖書館管理實務：{subject}與應用",
-        "閱讀素養：從{subject}到{subject2}",
-        "科普小百科：{subject}",
-        "資訊安全與倫理：{subject}案例解析",
-        "{subject}入門：給老師與學生的指南",
-        "校園圖書館工作手冊：{subject}篇",
-        "學校行政與{subject}：制度、流程與工具",
-        "孩子的{subject}練習：從小學到國中",
-        "{subject}專題研究：方法與實作",
-        "用{subject}理解{subject2}：給初學者的 30 堂課",
-        "{subject} × {subject2}：跨領域素養讀本",
-        "圖書館的{subject}：案例、表單與SOP",
-        "{subject}教學備課包：評量、活動與延伸閱讀",
-    ]
-
-    _CLASSIFICATIONS = [
-        # 這裡不追求完整分類法，只要「看起來像真的」即可支援 UI。
-        "028.5",  # 圖書館管理
-        "020.7",  # 圖書資訊
-        "371.3",  # 教學法
-        "410",  # 數學
-        "500",  # 自然科學
-        "610",  # 醫學/健康
-        "800",  # 文學
-        "900",  # 歷史地理
-        "158.2",  # 心理/成長
-        "004",  # 電腦/資訊
-        "005.1",  # 程式設計
-        "028.7",  # 閱讀推廣/讀者服務（示意）
-        "363.7",  # 環境議題（示意）
-    ]
+    )
 
     def __init__(self, rng: random.Random):
         self.rng = rng
-
-    def person_name(self) -> str:
-        surname = self.rng.choice(self._SURNAMES)
-        given = self.rng.choice(self._GIVEN_CHARS) + self.rng.choice(self._GIVEN_CHARS)
-        return surname + given
-
-    def publisher(self) -> str:
-        return self.rng.choice(self._PUBLISHERS)
-
-    def subject_terms(self, k: int) -> list[str]:
-        # sample：不重複抽樣（k 太大就截斷）
-        k = max(1, min(k, len(self._SUBJECTS)))
-        return self.rng.sample(self._SUBJECTS, k=k)
-
-    def bib_title(self) -> str:
-        subject = self.rng.choice(self._SUBJECTS)
-        subject2 = self.rng.choice(self._SUBJECTS)
-        edition = self.rng.randint(1, 6)
-        tpl = self.rng.choice(self._TITLE_TEMPLATES)
-        return tpl.format(subject=subject, subject2=subject2, edition=edition)
-
-    def classification(self) -> str:
-        return self.rng.choice(self._CLASSIFICATIONS)
+        # geographic/genre_terms 是少數仍「逐筆書目」呼叫的方法（其他欄位含 subjects 已改走 *_batch）
+        # → 建構時先把 rng.sample 與 class 詞彙表綁到 instance 上，呼叫時少走 bound method 建立 + class dict/MRO 查找
+        self._sample = rng.sample
+        self._geographics = self._GEOGRAPHICS
+        self._genres = self._GENRES
+
+    def person_name_batch(self, n: int) -> list[str]:
+        # 每個「字位」整批抽（rng.choices(k=...)）：n 個姓 + 2n 個名字用字，再逐列組字串
+        surnames = self.rng.choices(_SURNAMES, k=n)
+        given = self.rng.choices(_GIVEN_CHARS, k=2 * n)
+        return [s + g1 + g2 for s, g1, g2 in zip(surnames, given[0::2], given[1::2])]
+
+    def publisher_batch(self, n: int) -> list[str]:
+        return self.rng.choices(_PUBLISHERS, k=n)
+
+    def subject_terms_batch(self, ks: Sequence[int]) -> list[list[str]]:
+        # 整批 rng.choices（可重複抽樣）再逐組去重（dict.fromkeys 保序），取代逐筆 rng.sample：
+        # - sample 每次都要建 selected set + 走 Python 迴圈；choices 整批在一次呼叫內完成
+        # - 同一組偶爾抽到重複詞（k 只有 1..3、詞彙上百個，機率很低）→ 去重後不足 k 個的組，
+        #   再逐個 rng.choice 補到 k 個不重複為止（維持「每組恰好 ks[i] 個」的約定，與逐筆 sample 同數量）
+        ks = [max(1, min(k, len(_SUBJECTS))) for k in ks]
+        picks = self.rng.choices(_SUBJECTS, k=sum(ks))
+        out: list[list[str]] = []
+        short: list[int] = []
+        start = 0
+        for k in ks:
+            group = list(dict.fromkeys(picks[start : start + k]))
+            if len(group) < k:
+                short.append(len(out))
+            out.append(group)
+            start += k
+
+        # 補抽放在整批切組之後：不影響上面 picks 的切法（每組仍取自同一段 choices 結果）
+        choice = self.rng.choice
+        for i in short:
+            group = out[i]
+            k = ks[i]
+            while len(group) < k:
+                term = choice(_SUBJECTS)
+                if term not in group:
+                    group.append(term)
+        return out
+
+    def bib_title_batch(self, n: int) -> list[str]:
+        # 模板/主題詞/版次各整批抽一次，最後一次 list comprehension 套模板
+        subjects = self.rng.choices(_SUBJECTS, k=2 * n)
+        editions = self.rng.choices(range(1, 7), k=n)
+        templates = self.rng.choices(_TITLE_TEMPLATES_COMPILED, k=n)
+        return [
+            tpl.format(subject, subject2, edition)
+            for tpl, subject, subject2, edition in zip(templates, subjects[0::2], subjects[1::2], editions)
+        ]
+
+    def classification_batch(self, n: int) -> list[str]:
+        return self.rng.choices(_CLASSIFICATIONS, k=n)
 
     def geographic_terms(self, k: int) -> list[str]:
         # sample：允許 k=0（代表本筆書目沒有地理名稱）
-        k = max(0, min(k, len(self._GEOGRAPHICS)))
+        geographics = self._geographics
+        k = max(0, min(k, len(geographics)))
         if k == 0:
             return []
-        return self.rng.sample(self._GEOGRAPHICS, k=k)
+        return self._sample(geographics, k=k)
 
     def genre_terms(self, k: int) -> list[str]:
-        k = max(0, min(k, len(self._GENRES)))
+        genres = self._genres
+        k = max(0, min(k, len(genres)))
         if k == 0:
             return []
-        return self.rng.sample(self._GENRES, k=k)
-
-    def language_code(self) -> str:
-        # 語言分布：以 zh-TW 為主，少量混入其他語言（讓 UI 更像真實館藏）。
-        r = self.rng.random()
-        if r < 0.80:
-            return "zh-TW"
-        if r < 0.88:
-            return "zh"
-        if r < 0.94:
-            return "en"
-        if r < 0.965:
-            return "ja"
-        if r < 0.98:
-            return "ko"
-        if r < 0.99:
-            return "vi"
-        return "id"
-
-
-class HuggingFaceTextProvider(TextProvider):
+        return self._sample(genres, k=k)
+
+    # 語言分布（累積機率；順序對齊 _LANGUAGES）：以 zh-TW 為主，少量混入其他語言（讓 UI 更像真實館藏）
+    # zh-TW 80%、zh 8%、en 6%、ja 2.5%、ko 1.5%、vi 1%、id 1%
+    _LANGUAGE_CUM_WEIGHTS = (0.80, 0.88, 0.94, 0.965, 0.98, 0.99, 1.0)
+
+    def language_code_batch(self, n: int) -> list[str]:
+        # rng.choices + cum_weights：每個值都是「抽 [0,1) 再找落在哪一段」，整批在 C 迴圈內做完
+        return self.rng.choices(self._LANGUAGES, cum_weights=self._LANGUAGE_CUM_WEIGHTS, k=n)
+
+
+def make_hf_text_provider(rng: random.Random) -> TextProvider:
     """
-    HuggingFaceTextProvider（保留介面）
+    hf provider（保留介面）
 
     這裡先不把 transformers/torch 直接做成 repo 的強依賴，原因：
     - 下載與安裝成本高（尤其 Playwright/瀏覽器/LLM 同時導入時）
@@ -842,45 +929,24 @@ class HuggingFaceTextProvider(TextProvider):
     如果你真的要啟用 HF 模型：
     1) 你可以改 docker/seed-scale.Dockerfile 加上 pip 安裝 transformers/torch
     2) 透過 env 指定 model（例如 SCALE_HF_MODEL=...）
-    3) 這裡再把實作補上（建議用固定 seed + 固定 prompt 模板確保可重現）
-    """
-
-    def __init__(self, rng: random.Random):
-        self.rng = rng
-        raise RuntimeError(
-            "HuggingFaceTextProvider 尚未內建依賴（transformers/torch）。"
-            "請先用 rules provider，或指定要用的模型與安裝策略後我再幫你補上。"
-        )
-
-    def person_name(self) -> str:
-        raise NotImplementedError
-
-    def publisher(self) -> str:
-        raise NotImplementedError
-
-    def subject_terms(self, k: int) -> list[str]:
-        raise NotImplementedError
+    3) 在這個函式內 import transformers/torch，再回傳實作 TextProvider 的物件
+       （建議用固定 seed + 固定 prompt 模板確保可重現）
 
-    def bib_title(self) -> str:
-        raise NotImplementedError
-
-    def classification(self) -> str:
-        raise NotImplementedError
-
-    def geographic_terms(self, k: int) -> list[str]:
-        raise NotImplementedError
-
-    def genre_terms(self, k: int) -> list[str]:
-        raise NotImplementedError
+    為什麼是函式而不是 class：
+    - 重依賴只在真的選 hf 時才 import；rules 路徑（預設）不付模組載入成本
+    - 介面本身由 TextProvider 定義，不需要再留一份全是 NotImplementedError 的 stub
+    """
 
-    def language_code(self) -> str:
-        raise NotImplementedError
+    raise RuntimeError(
+        "hf text provider 尚未內建依賴（transformers/torch）。"
+        "請先用 rules provider，或指定要用的模型與安裝策略後我再幫你補上。"
+    )
 
 
 def make_text_provider(cfg: ScaleConfig, rng: random.Random) -> TextProvider:
     if cfg.text_provider == "rules":
         return RulesTextProvider(rng)
-    return HuggingFaceTextProvider(rng)
+    return make_hf_text_provider(rng)
 
 
 def validate_rules_vocab() -> None:
@@ -895,7 +961,7 @@ def validate_rules_vocab() -> None:
       但後續 UI/expand/ancestors 會出現不可預期行為。
     """
 
-    def assert_unique_preferred(kind: str, labels: list[str]) -> set[str]:
+    def assert_unique_preferred(kind: str, labels: Sequence[str]) -> set[str]:
         seen: set[str] = set()
         for label in labels:
             s = str(label).strip()
@@ -945,27 +1011,46 @@ def validate_rules_vocab() -> None:
                 raise SystemExit(f"[seed-scale] rules vocab {kind}: related edge self-loop: {a!r}")
 
     def assert_acyclic(kind: str, broader_edges: list[tuple[str, str]]) -> None:
+        # Kahn topological sort（迭代、O(V+E)）：
+        # - 反覆移除「in-degree = 0」的節點；若最後還有節點移不掉，代表它們在 cycle 上（或被 cycle 指向）
+        # - 不用遞迴 DFS：詞彙庫變大時不會撞遞迴深度，也不必每走一步就複製一次 path list
         graph: dict[str, list[str]] = {}
+        indeg: dict[str, int] = {}
         for child, parent in broader_edges:
             graph.setdefault(child, []).append(parent)
-
-        visiting: set[str] = set()
-        visited: set[str] = set()
-
-        def dfs(node: str, path: list[str]) -> None:
-            if node in visiting:
-                cycle = " → ".join(path + [node])
-                raise SystemExit(f"[seed-scale] rules vocab {kind}: broader edges contains cycle: {cycle}")
-            if node in visited:
-                return
-            visiting.add(node)
+            indeg.setdefault(child, 0)
+            indeg[parent] = indeg.get(parent, 0) + 1
+
+        ready = [node for node, d in indeg.items() if d == 0]
+        processed = 0
+        while ready:
+            node = ready.pop()
+            processed += 1
             for nxt in graph.get(node, []):
-                dfs(nxt, path + [node])
-            visiting.remove(node)
-            visited.add(node)
+                indeg[nxt] -= 1
+                if indeg[nxt] == 0:
+                    ready.append(nxt)
 
-        for node in graph.keys():
-            dfs(node, [])
+        if processed == len(indeg):
+            return
+
+        # 有 cycle：從剩下的節點「逆著 edge」往回走（每個剩下的節點一定還有剩下的前驅），
+        # 第一次走回已走過的節點時，那一段就是一個 cycle（錯誤訊息才好除錯）
+        remaining = {node for node, d in indeg.items() if d > 0}
+        preds: dict[str, list[str]] = {}
+        for child, parent in broader_edges:
+            if child in remaining and parent in remaining:
+                preds.setdefault(parent, []).append(child)
+        node = min(remaining)
+        path: list[str] = []
+        index_in_path: dict[str, int] = {}
+        while node not in index_in_path:
+            index_in_path[node] = len(path)
+            path.append(node)
+            node = preds[node][0]
+        cycle_nodes = path[index_in_path[node] :][::-1]
+        cycle = " → ".join(cycle_nodes + [cycle_nodes[0]])
+        raise SystemExit(f"[seed-scale] rules vocab {kind}: broader edges contains cycle: {cycle}")
 
     # subjects
     subject_pref = assert_unique_preferred("subject", RulesTextProvider._SUBJECTS)
@@ -992,14 +1077,19 @@ def validate_rules_vocab() -> None:
     assert_acyclic("genre", RulesTextProvider._GENRE_BROADER_EDGES)
 
 
+def dedupe_keep_order(values: Iterable[str]) -> list[str]:
+    # 去重（保序）+ 去掉空白/空字串：dict 保留插入順序 → dict.fromkeys 就是 C 層的「保序 set」
+    return list(dict.fromkeys(s for s in (str(v).strip() for v in values) if s))
+
+
 # ----------------------------
 # 2) Postgres / CSV helper
 # ----------------------------
 
 
-def pg_null() -> str:
-    # COPY 的 NULL 我們統一用 \N（並在 \\copy 指定 NULL '\\N'）
-    return r"\N"
+# COPY 的 NULL 我們統一用 \N（並在 COPY 指定 NULL '\\N'）
+# - 用常數而不是函式：items/loans/holds 每列都有好幾個 NULL 欄位，不必每格都多一次函式呼叫
+PG_NULL = r"\N"
 
 
 def pg_array(values: list[str] | None) -> str:
@@ -1010,26 +1100,38 @@ def pg_array(values: list[str] | None) -> str:
     """
 
     if values is None:
-        return pg_null()
+        return PG_NULL
     if len(values) == 0:
         return "{}"
 
-    # array element：以雙引號包起來，並做最小 escape（避免逗號/空白造成解析問題）
-    escaped: list[str] = []
-    for v in values:
-        s = str(v)
-        s = s.replace("\\", "\\\\").replace('"', '\\"')
-        escaped.append(f'"{s}"')
-    return "{" + ",".join(escaped) + "}"
+    return "{" + ",".join(map(pg_array_element, values)) + "}"
+
+
+@functools.lru_cache(maxsize=None)
+def pg_array_element(value: str) -> str:
+    """
+    array element：以雙引號包起來，並做最小 escape（避免逗號/空白造成解析問題）。
+
+    為什麼 cache：
+    - pg_array 每本書目會呼叫多次（creators/subjects/...），但元素幾乎都來自封閉詞彙庫（姓名/主題詞）
+    - 不同值的數量很小 → 暖機後每個元素都是一次 dict 查詢，而不是兩次 replace + 重新組字串
+    """
+
+    s = str(value)
+    s = s.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{s}"'
 
 
 def jsonb(value: object) -> str:
     """
-    產生 JSONB 欄位的字串內容（給 psql \\copy 用）。
+    產生 JSONB 欄位的字串內容（給 load script 的 COPY ... FROM STDIN 用）。
 
     注意：
     - 我們用 ensure_ascii=False 保留 UTF-8（繁中不變成 \\uXXXX）
-    - \\copy (FORMAT csv) 會把欄位視為 text，再由 Postgres cast 成 jsonb
+    - COPY 會把欄位視為 text，再由 Postgres cast 成 jsonb；這裡只產生 JSON 本身，格式相關的 escape 交給寫出端：
+      - CSV（write_copy，例如 bibs 的 marc_extras）：csv.writer 會自動處理雙引號/逗號/換行
+      - text format（write_copy_text）：反斜線/Tab/換行要先過 copy_text_field
+        （JSON 字串裡的 `\\"`、`\\n` 也含反斜線；escape=False 的表若放 JSON，必須在產生時先 escape）
     """
 
     return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
@@ -1057,9 +1159,97 @@ def marc_data_field(
     }
 
 
+@functools.lru_cache(maxsize=8)
+def _uuid5_sha1_prefix(ns: uuid.UUID) -> hashlib._Hash:
+    # uuid5 = SHA-1(namespace bytes + name)；namespace 部分對同一個 ns 永遠一樣 → 先 hash 好，之後只 copy()
+    return hashlib.sha1(ns.bytes)
+
+
 def uuid5(ns: uuid.UUID, name: str) -> str:
-    # uuid5 是「可重現」的：相同 name → 相同 UUID
-    return str(uuid.uuid5(ns, name))
+    """
+    uuid5 是「可重現」的：相同 name → 相同 UUID。
+
+    結果與 str(uuid.uuid5(ns, name)) 逐位元相同，但整份 seed 會呼叫數萬次，所以做了兩件事：
+    - namespace 的 SHA-1 前綴只算一次（copy() 已 update 過 ns.bytes 的 hasher），每次只 hash name
+    - 直接在 hexdigest 字串上設定 version/variant 並輸出，不建立 uuid.UUID 物件（省掉 int 轉換與物件配置）
+    """
+
+    h = _uuid5_sha1_prefix(ns).copy()
+    h.update(name.encode("utf-8"))
+    return _uuid5_from_sha1_hex(h.hexdigest())
+
+
+def uuid5_series(ns: uuid.UUID, prefix: str) -> Callable[[str], str]:
+    """
+    同一張表的 id 都長成 uuid5(ns, prefix + 序號)：prefix（例如 "{org}:audit:"）每列都一樣。
+
+    回傳的函式等同 lambda suffix: uuid5(ns, prefix + suffix)（結果逐位元相同），
+    但 hasher 已經先 update 過 ns.bytes + prefix → 每列只需 copy() 再 hash 短短的 suffix。
+    """
+
+    base = _uuid5_sha1_prefix(ns).copy()
+    base.update(prefix.encode("utf-8"))
+    base_copy = base.copy
+
+    def make(suffix: str) -> str:
+        h = base_copy()
+        h.update(suffix.encode("utf-8"))
+        return _uuid5_from_sha1_hex(h.hexdigest())
+
+    return make
+
+
+def uuid5_numbered_series(ns: uuid.UUID, prefix: str, width: int) -> Callable[[int], str]:
+    """
+    uuid5_series 的「流水號」版：等同 lambda n: uuid5(ns, f"{prefix}{n:0{width}d}")。
+
+    流水號直接用 bytes 的 %-format 產生（b"%08d" % n 走 C 的快速路徑），
+    省掉每列「f-string 組 str → 再 encode 成 bytes」兩步。
+    """
+
+    base = _uuid5_sha1_prefix(ns).copy()
+    base.update(prefix.encode("utf-8"))
+    base_copy = base.copy
+    number_format = b"%0" + str(width).encode("ascii") + b"d"
+
+    def make(n: int) -> str:
+        h = base_copy()
+        h.update(number_format % n)
+        return _uuid5_from_sha1_hex(h.hexdigest())
+
+    return make
+
+
+# RFC 4122 variant：第 17 個 hex 字元的高 2 bits 固定為 10 → 只可能是 8/9/a/b（以原本的 hex 值查表）
+_UUID_VARIANT_HEX = "89ab" * 4
+
+
+def _uuid5_from_sha1_hex(x: str) -> str:
+    # 直接在 hexdigest 字串上套 version/variant（不經 bytearray 來回轉換）：
+    # - version 5：第 13 個 hex 字元固定為 "5"
+    # - variant：第 17 個 hex 字元查 _UUID_VARIANT_HEX
+    return f"{x[:8]}-{x[8:12]}-5{x[13:16]}-{_UUID_VARIANT_HEX[int(x[16], 16)]}{x[17:20]}-{x[20:32]}"
+
+
+def validate_uuid5_fast_path() -> None:
+    """
+    啟動時自我檢查：uuid5/uuid5_series/uuid5_numbered_series 必須與標準庫 uuid.uuid5 逐位元相同。
+
+    這些 id 會寫進 DB，且要求「同一組 seed/org_code → 永遠同一個 UUID」；
+    若快速路徑哪天被改壞（例如 version/variant 位元），寧可一開始就停下，也不要默默產生另一套 id。
+    """
+
+    ns = uuid.UUID("00000000-0000-0000-0000-000000000000")
+    for n in (0, 1, 7, 1234567):
+        name = f"seed-scale:self-check:{n:07d}"
+        expected = str(uuid.uuid5(ns, name))
+        got = (
+            uuid5(ns, name),
+            uuid5_series(ns, "seed-scale:self-check:")(f"{n:07d}"),
+            uuid5_numbered_series(ns, "seed-scale:self-check:", 7)(n),
+        )
+        if any(v != expected for v in got):
+            raise SystemExit(f"[seed-scale] uuid5 fast path mismatch for {name!r}: {got} != {expected}")
 
 
 def now_utc() -> dt.datetime:
@@ -1068,11 +1258,12 @@ def now_utc() -> dt.datetime:
 
 def iso(dt_value: dt.datetime | None) -> str:
     if dt_value is None:
-        return pg_null()
+        return PG_NULL
     # Postgres timestamptz 可吃 ISO 8601
     return dt_value.isoformat()
 
 
+@functools.lru_cache(maxsize=16)
 def compute_scrypt_v1(password: str, salt_b64_string: str) -> str:
     """
     對齊 apps/api 的 scrypt-v1（Node crypto.scrypt 的預設參數）：
@@ -1082,6 +1273,11 @@ def compute_scrypt_v1(password: str, salt_b64_string: str) -> str:
     重要細節：
     - apps/api 把 salt 存成 base64 字串，但「拿去 scrypt 的 salt」是這個字串本身（UTF-8 bytes）
       → 我們在 Python 端也必須用 salt_b64_string.encode("utf-8")，不要 base64 decode。
+
+    為什麼加 lru_cache？
+    - scrypt 是刻意設計成「又慢又吃記憶體」的 KDF（N=16384 每次約 16 MiB、數十 ms）
+    - 相同 (password, salt) 的結果必然相同 → 快取後成本只跟「不同密碼數」有關，
+      即使未來改成替更多帳號建立 credentials，也不會對每個人重跑一次 scrypt
     """
 
     dk = hashlib.scrypt(
@@ -1098,11 +1294,12 @@ def compute_scrypt_v1(password: str, salt_b64_string: str) -> str:
 def deterministic_salt_b64(seed: int) -> str:
     """
     產生一個「固定可重現」的 salt（16 bytes → base64 字串）。
-    - 我們用 SHA-256(seed) 的前 16 bytes，避免依賴系統隨機來源。
+    - 我們用 BLAKE2b(seed, digest_size=16)，避免依賴系統隨機來源。
+    - BLAKE2b 可直接指定輸出 16 bytes（不必像 SHA-256 先算 32 bytes 再截斷）
+    - salt 會連同 hash 一起寫進 user_credentials，API 驗證時讀 DB 的 salt → 換演算法不影響登入
     """
 
-    digest = hashlib.sha256(f"seed-scale:{seed}".encode("utf-8")).digest()
-    raw16 = digest[:16]
+    raw16 = hashlib.blake2b(f"seed-scale:{seed}".encode("utf-8"), digest_size=16).digest()
     return base64.b64encode(raw16).decode("ascii")
 
 
@@ -1118,11 +1315,305 @@ def run_psql(args: list[str], *, cwd: Path | None = None) -> None:
     subprocess.run(cmd, cwd=str(cwd) if cwd else None, check=True)
 
 
-def write_csv(path: Path, rows: list[list[str]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.writer(f)
-        w.writerows(rows)
+def start_psql_stream() -> subprocess.Popen[str]:
+    """
+    啟動一個讀 stdin 的 psql（psql -f -），之後整支 seed 的 SQL 都透過同一個 session 送進去。
+
+    - 只連線/認證一次（schema + load 不再各開一個 psql 行程）
+    - 分段寫入：write_psql_stream 每寫完一段就 flush，psql 會立刻開始執行那一段
+      （例如先送 schema，讓 DB 套 schema 與 Python 生成資料重疊）
+    - 最後用 finish_psql_stream 關閉 stdin 並檢查 exit code
+    """
+
+    cmd = ["psql", "-v", "ON_ERROR_STOP=1", "-f", "-"]
+    print(f"[seed-scale] $ {' '.join(cmd)} < (schema + load script)")
+    # stdin 用 1 MiB 緩衝（預設只有 8 KiB）：COPY 資料列累積成大塊才寫進 pipe，減少 write syscall 與 psql 端的喚醒次數
+    proc = subprocess.Popen(
+        cmd, stdin=subprocess.PIPE, text=True, encoding="utf-8", bufsize=COPY_WRITE_BUFFER_SIZE
+    )
+    assert proc.stdin is not None
+    return proc
+
+
+def write_psql_stream(proc: subprocess.Popen[str], write_script: Callable[[TextIO], None]) -> None:
+    # 若 psql 因錯誤提早結束（ON_ERROR_STOP），寫入端會遇到 BrokenPipeError；
+    # 真正的錯誤訊息 psql 已印在 stderr，這裡先忽略，由 finish_psql_stream 用 exit code 回報即可
+    assert proc.stdin is not None
+    try:
+        write_script(proc.stdin)
+        proc.stdin.flush()
+    except BrokenPipeError:
+        pass
+
+
+def finish_psql_stream(proc: subprocess.Popen[str]) -> None:
+    assert proc.stdin is not None
+    try:
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, proc.args)
+
+
+def abort_psql_stream(proc: subprocess.Popen[str]) -> None:
+    # 生成/寫出途中失敗時用：關閉 stdin 並等 psql 結束（不檢查 exit code，呼叫端會把原本的例外往外丟）
+    # - 此時送進去的只有 schema（idempotent），或是還沒 COMMIT 的 load 交易 → psql 結束時整包 rollback
+    assert proc.stdin is not None
+    try:
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    proc.wait()
+
+
+def write_copy(out: TextIO, table: str, columns: str, rows: Iterable[Sequence[str]]) -> None:
+    """
+    把一張表寫成 psql script 裡的「COPY ... FROM STDIN」區塊：COPY 指令 → CSV 資料列 → 單獨一行 `\\.`。
+
+    COPY CSV 的 NULL marker 我們統一用 `\\N`（而不是空字串），因為：
+    - 數字/時間欄位若用空字串，某些情境下容易被誤解成空白字串而非 NULL（尤其人眼檢查時）
+    - `\\N` 是 Postgres/psql 最常見的 NULL marker（可讀性高）
+
+    注意：lineterminator 用 `\\n`，讓 CSV 列與 `\\.` 結束行的換行一致。
+    """
+
+    out.write(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{PG_NULL}');\n")
+    csv.writer(out, lineterminator="\n").writerows(rows)
+    out.write("\\.\n")
+
+
+def copy_text_field(value: str) -> str:
+    # COPY text format 的欄位 escape：反斜線/Tab/換行要轉成 \\、\t、\n、\r
+    # - NULL marker（\N）本身就是要原樣送出的 escape，不能再被轉義
+    if value == PG_NULL:
+        return value
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def write_copy_text(
+    out: TextIO, table: str, columns: str, rows: Iterable[Sequence[str]], *, escape: bool = True
+) -> None:
+    """
+    同 write_copy，但改用 COPY 的 text format（Tab 分隔；Postgres 預設格式）。
+
+    用在「列數最多、欄位又寬」的表（item_copies / loans / holds / inventory_scans / audit_events）：
+    - CSV 在 server 端要跑引號狀態機（每個欄位都要判斷是否被 "..." 包起來、"" 是否為跳脫）
+    - text format 只需要切 Tab + 處理反斜線 escape → server 端解析較省，client 端也只剩一次 join
+    - 這些表的欄位幾乎都是 UUID/時間/enum/代碼（audit 的 metadata 是固定的一小段 JSON），escape 通常不會真的發生
+
+    為什麼不用 binary COPY：
+    - psql 在 script 內讀 binary COPY 資料時會一路讀到輸入結尾（不像 text/csv 以 `\\.` 結束）
+    - 我們的 load script 是「同一個 psql session + 同一個交易」串起所有表（RLS set_config 也靠它）
+      → 一旦某張表改成 binary，就得拆成多個 psql 行程/交易，反而破壞 rollback 的保證
+
+    escape=False：呼叫端保證每個欄位都不含反斜線/Tab/換行（UUID、ISO 時間、enum、已 escape 過的常數）
+    → 每列只剩一次 "\t".join，省掉每個欄位一次 copy_text_field（列數最多的表，這一步佔了大半寫出時間）
+    """
+
+    out.write(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT text, NULL '{PG_NULL}');\n")
+    if escape:
+        out.writelines("\t".join(map(copy_text_field, row)) + "\n" for row in rows)
+    else:
+        out.writelines("\t".join(row) + "\n" for row in rows)
+    out.write("\\.\n")
+
+
+# ----------------------------
+# 2.1) 大表暫存：欄位式（SoA）
+# ----------------------------
+#
+# users/bibs/items/loans 是列數最多的幾張表；若每列都是 dict（10+ 個 key），光 dict 本身就佔掉大部分記憶體。
+# 這裡改成「每個欄位一個 list」（structure of arrays）：
+# - 第 i 列 = 每個欄位 list 的第 i 個元素（用 index 串起來；例如 items.status[i] = "lost"）
+# - 整張表都相同的欄位（organization_id、notes=NULL）不存，寫 COPY 時再用 itertools.repeat 補上
+# - 寫 COPY 時直接 zip(各欄位) 產生 row，不必先組 dict 再拆回 list
+
+
+@dataclasses.dataclass(slots=True)
+class UserColumns:
+    id: list[str] = dataclasses.field(default_factory=list)
+    external_id: list[str] = dataclasses.field(default_factory=list)
+    name: list[str] = dataclasses.field(default_factory=list)
+    role: list[str] = dataclasses.field(default_factory=list)
+    org_unit: list[str] = dataclasses.field(default_factory=list)
+    status: list[str] = dataclasses.field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def append(self, *, id: str, external_id: str, name: str, role: str, org_unit: str, status: str) -> None:
+        self.id.append(id)
+        self.external_id.append(external_id)
+        self.name.append(name)
+        self.role.append(role)
+        self.org_unit.append(org_unit)
+        self.status.append(status)
+
+
+@dataclasses.dataclass(slots=True)
+class BibColumns:
+    id: list[str] = dataclasses.field(default_factory=list)
+    title: list[str] = dataclasses.field(default_factory=list)
+    creators: list[str] = dataclasses.field(default_factory=list)
+    contributors: list[str] = dataclasses.field(default_factory=list)
+    publisher: list[str] = dataclasses.field(default_factory=list)
+    published_year: list[str] = dataclasses.field(default_factory=list)
+    language: list[str] = dataclasses.field(default_factory=list)
+    subjects: list[str] = dataclasses.field(default_factory=list)
+    geographics: list[str] = dataclasses.field(default_factory=list)
+    genres: list[str] = dataclasses.field(default_factory=list)
+    # isbn_body：ISBN 去掉 "978" 前綴後的 10 位數（先存 int，寫 COPY 時才格式化；見 isbns()）
+    # - 用 array（64-bit unsigned）存原生整數：每列 8 bytes，不是「指標 + 一個 int 物件」
+    isbn_body: array.array[int] = dataclasses.field(default_factory=lambda: array.array("Q"))
+    classification: list[str] = dataclasses.field(default_factory=list)
+    marc_extras: list[str] = dataclasses.field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def append(
+        self,
+        *,
+        id: str,
+        title: str,
+        creators: str,
+        contributors: str,
+        publisher: str,
+        published_year: str,
+        language: str,
+        subjects: str,
+        geographics: str,
+        genres: str,
+        isbn_body: int,
+        classification: str,
+        marc_extras: str,
+    ) -> None:
+        self.id.append(id)
+        self.title.append(title)
+        self.creators.append(creators)
+        self.contributors.append(contributors)
+        self.publisher.append(publisher)
+        self.published_year.append(published_year)
+        self.language.append(language)
+        self.subjects.append(subjects)
+        self.geographics.append(geographics)
+        self.genres.append(genres)
+        self.isbn_body.append(isbn_body)
+        self.classification.append(classification)
+        self.marc_extras.append(marc_extras)
+
+    def isbns(self) -> Iterator[str]:
+        # ISBN 只在寫 COPY 時用一次 → 邊寫邊格式化，不把上千個字串一路留在記憶體裡
+        return (f"978{n:010d}" for n in self.isbn_body)
+
+
+@dataclasses.dataclass(slots=True)
+class ItemColumns:
+    id: list[str] = dataclasses.field(default_factory=list)
+    bibliographic_id: list[str] = dataclasses.field(default_factory=list)
+    barcode: list[str] = dataclasses.field(default_factory=list)
+    # call_number = f"{書目分類號} {書目序號:04d}-{冊次}"：只存兩個序號，寫 COPY 時才組字串（見 call_numbers()）
+    # - 兩個序號都是小整數 → 用 array（32-bit unsigned）存原生整數，比 list[int] 省很多記憶體
+    bib_no: array.array[int] = dataclasses.field(default_factory=lambda: array.array("I"))
+    copy_no: array.array[int] = dataclasses.field(default_factory=lambda: array.array("I"))
+    location_id: list[str] = dataclasses.field(default_factory=list)
+    status: list[str] = dataclasses.field(default_factory=list)
+    acquired_at: list[str] = dataclasses.field(default_factory=list)
+    last_inventory_at: list[str] = dataclasses.field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def append(
+        self,
+        *,
+        id: str,
+        bibliographic_id: str,
+        barcode: str,
+        bib_no: int,
+        copy_no: int,
+        location_id: str,
+        status: str,
+        acquired_at: str,
+        last_inventory_at: str,
+    ) -> None:
+        self.id.append(id)
+        self.bibliographic_id.append(bibliographic_id)
+        self.barcode.append(barcode)
+        self.bib_no.append(bib_no)
+        self.copy_no.append(copy_no)
+        self.location_id.append(location_id)
+        self.status.append(status)
+        self.acquired_at.append(acquired_at)
+        self.last_inventory_at.append(last_inventory_at)
+
+    def call_numbers(self, bibs: BibColumns) -> Iterator[str]:
+        classifications = bibs.classification
+        return (f"{classifications[b - 1]} {b:04d}-{c}" for b, c in zip(self.bib_no, self.copy_no))
+
+
+@dataclasses.dataclass(slots=True)
+class LoanColumns:
+    id: list[str] = dataclasses.field(default_factory=list)
+    item_id: list[str] = dataclasses.field(default_factory=list)
+    user_id: list[str] = dataclasses.field(default_factory=list)
+    checked_out_at: list[str] = dataclasses.field(default_factory=list)
+    due_at: list[str] = dataclasses.field(default_factory=list)
+    returned_at: list[str] = dataclasses.field(default_factory=list)
+    renewed_count: list[str] = dataclasses.field(default_factory=list)
+    status: list[str] = dataclasses.field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def append(
+        self,
+        *,
+        id: str,
+        item_id: str,
+        user_id: str,
+        checked_out_at: str,
+        due_at: str,
+        returned_at: str,
+        renewed_count: str,
+        status: str,
+    ) -> None:
+        self.id.append(id)
+        self.item_id.append(item_id)
+        self.user_id.append(user_id)
+        self.checked_out_at.append(checked_out_at)
+        self.due_at.append(due_at)
+        self.returned_at.append(returned_at)
+        self.renewed_count.append(renewed_count)
+        self.status.append(status)
+
+    def extend(
+        self,
+        *,
+        id: Sequence[str],
+        item_id: Sequence[str],
+        user_id: Sequence[str],
+        checked_out_at: Sequence[str],
+        due_at: Sequence[str],
+        returned_at: Sequence[str],
+        renewed_count: Sequence[str],
+        status: Sequence[str],
+    ) -> None:
+        # 整批版 append：每個欄位一次給一整段（長度必須相同），給 closed loans 這種「欄位可各自一次算完」的大量列
+        # - 每欄一次 list.extend（C 層 + 一次擴容），取代每列一次 append 呼叫（keyword 參數 + 8 次 append）
+        columns = (id, item_id, user_id, checked_out_at, due_at, returned_at, renewed_count, status)
+        if len({len(col) for col in columns}) > 1:
+            raise ValueError("LoanColumns.extend: column lengths differ")
+        self.id.extend(id)
+        self.item_id.extend(item_id)
+        self.user_id.extend(user_id)
+        self.checked_out_at.extend(checked_out_at)
+        self.due_at.extend(due_at)
+        self.returned_at.extend(returned_at)
+        self.renewed_count.extend(renewed_count)
+        self.status.extend(status)
 
 
 # ----------------------------
@@ -1132,31 +1623,76 @@ def write_csv(path: Path, rows: list[list[str]]) -> None:
 
 def main() -> None:
     cfg = load_config()
+    validate_uuid5_fast_path()
+
+    # 1) workdir（僅檢查模式）：每次都清空（避免舊檔案殘留，讓人誤以為是這次產生的資料）
+    # - 只清「內容」、保留 workdir 本身：它常是 docker volume / bind mount 的掛載點（rmdir 會 EBUSY）
+    # - 子資料夾交給 shutil.rmtree（scandir + fd 相對刪除，巢狀多層也刪得乾淨）；symlink 只拿掉連結本身
+    if cfg.workdir is not None:
+        if cfg.workdir.exists():
+            for p in cfg.workdir.iterdir():
+                if p.is_dir() and not p.is_symlink():
+                    shutil.rmtree(p)
+                else:
+                    p.unlink()
+        cfg.workdir.mkdir(parents=True, exist_ok=True)
+
+    # 1.1) 套用 schema（與資料生成並行）
+    # schema.sql 是 idempotent（CREATE IF NOT EXISTS），先跑一次保險。
+    # - 不直接依賴 cwd，避免你在不同 working directory 執行導致找不到檔案（\i 用絕對路徑）。
+    # - 整支 seed 只開「一個」psql session：先把 `\i schema.sql` 送進 stdin（psql 立刻開始套 schema），
+    #   Python 端同時生成資料；生成完再把 load script 接著送進同一個 session（第 5 步）。
+    # - 資料生成本身不拆多行程：所有表共用同一個 seeded rng（抽樣順序＝可重現性），
+    #   匯入也必須是同一個 session/交易（RLS set_config + 失敗整包 rollback）。
+    repo_root = Path(__file__).resolve().parents[1]
+    schema_path = repo_root / "db/schema.sql"
+
+    def write_schema_include(out: TextIO) -> None:
+        out.write(f"\\i '{schema_path}'\n")
+
+    # 詞彙庫驗證不依賴 rng/DB → 在啟動 psql 之前先做：設定/字庫有誤時直接結束，不會先套 schema
+    if cfg.text_provider == "rules":
+        validate_rules_vocab()
 
-    # 1) workdir：每次都清空（避免舊檔案殘留造成 \\copy 讀到錯的資料）
-    if cfg.workdir.exists():
-        for p in cfg.workdir.glob("*"):
-            try:
-                p.unlink()
-            except IsADirectoryError:
-                # 理論上不會有資料夾；保險起見
-                for sub in p.rglob("*"):
-                    if sub.is_file():
-                        sub.unlink()
-                p.rmdir()
-    cfg.workdir.mkdir(parents=True, exist_ok=True)
+    psql_stream = start_psql_stream() if cfg.workdir is None else None
+    if psql_stream is not None:
+        write_psql_stream(psql_stream, write_schema_include)
 
+    # 生成途中仍可能 SystemExit（例如 open loans 超過可借冊數、沒有可借閱的使用者）
+    # → 任何例外都先關掉 psql 的 stdin 並等它結束，再把例外往外丟：
+    #   錯誤訊息一定是最後一行（不會被 psql 稍後的輸出蓋過），也不會留下還在跑的 psql 行程
+    try:
+        generate_and_load(cfg, psql_stream, write_schema_include)
+    except BaseException:
+        if psql_stream is not None:
+            abort_psql_stream(psql_stream)
+        raise
+
+
+def generate_and_load(
+    cfg: ScaleConfig,
+    psql_stream: subprocess.Popen[str] | None,
+    write_schema_include: Callable[[TextIO], None],
+) -> None:
     # 2) RNG：整支腳本的「可重現核心」
     rng = random.Random(cfg.seed)
+    rand = rng.random  # 整批抽 [0,1) 時用（省掉每次的屬性查找）
     text = make_text_provider(cfg, rng)
-    if cfg.text_provider == "rules":
-        validate_rules_vocab()
 
     # 3) namespace：所有 ID 都用 uuid5 生成（可重現且不依賴 DB gen_random_uuid）
     ns = uuid.UUID("7b4a3b9d-9a55-4f03-9d9e-7d9edb1c5f6b")
 
     org_id = uuid5(ns, f"org:{cfg.org_code}")
 
+    # 時間基準：整份 seed 共用同一個 now，且 loans/holds/items/audit 的偏移量都是「整天」
+    # → 同一個 day offset 一定得到同一個 ISO 字串，用 cache 把 datetime/timedelta/isoformat 的成本
+    #   從「每列好幾次」降到「每個不同天數一次」（天數範圍只有幾百種）
+    now = now_utc()
+
+    @functools.lru_cache(maxsize=None)
+    def iso_days_from_now(days: int) -> str:
+        return iso(now + dt.timedelta(days=days))
+
     # 4) 固定 demo 密碼（只給少數帳號）
     salt = deterministic_salt_b64(cfg.seed)
     password_hash = compute_scrypt_v1(cfg.password, salt)
@@ -1183,8 +1719,8 @@ def main() -> None:
                 "organization_id": org_id,
                 "code": code,
                 "name": name,
-                "area": area if area else pg_null(),
-                "shelf_code": shelf if shelf else pg_null(),
+                "area": area if area else PG_NULL,
+                "shelf_code": shelf if shelf else PG_NULL,
                 "status": status,
             }
         )
@@ -1195,30 +1731,31 @@ def main() -> None:
     add_location("STORAGE", "庫房（示範）", "後勤區", "S-00", "active")
     add_location("CLOSED", "已停用館別（示範）", "舊館", "X-00", "inactive")
 
-    loc_main = next(l for l in locations if l["code"] == "MAIN")["id"]
-    loc_branch = next(l for l in locations if l["code"] == "BRANCH")["id"]
-    loc_classroom = next(l for l in locations if l["code"] == "CLASSROOM")["id"]
-    loc_storage = next(l for l in locations if l["code"] == "STORAGE")["id"]
+    # code → id 只建一次（O(1) 查詢；也不怕 add_location 的順序被調整）
+    loc_by_code: dict[str, str] = {l["code"]: l["id"] for l in locations}
+    loc_main = loc_by_code["MAIN"]
+    loc_branch = loc_by_code["BRANCH"]
+    loc_classroom = loc_by_code["CLASSROOM"]
+    loc_storage = loc_by_code["STORAGE"]
 
     # ----------------------------
     # 3.3 users（staff + teacher + student）
     # - 重要：StaffAuth 需要 user_credentials 才能登入
     # - 我們只給：A0001/L0001/T0001/S1130123 建 credentials（其他人僅做列表/搜尋資料）
     # ----------------------------
-    users: list[dict[str, str]] = []
+    users = UserColumns()
+    # 大量列的 id 都用 uuid5_series / uuid5_numbered_series：每張表的 "{org}:<table>:" 前綴只 hash 一次
+    user_uuid = uuid5_series(ns, f"{cfg.org_code}:user:")
 
     def add_user(external_id: str, name: str, role: str, org_unit: str | None, status: str) -> str:
-        user_id = uuid5(ns, f"{cfg.org_code}:user:{external_id}")
+        user_id = user_uuid(external_id)
         users.append(
-            {
-                "id": user_id,
-                "organization_id": org_id,
-                "external_id": external_id,
-                "name": name,
-                "role": role,
-                "org_unit": org_unit if org_unit else pg_null(),
-                "status": status,
-            }
+            id=user_id,
+            external_id=external_id,
+            name=name,
+            role=role,
+            org_unit=org_unit if org_unit else PG_NULL,
+            status=status,
         )
         return user_id
 
@@ -1232,20 +1769,29 @@ def main() -> None:
     # - 讓 E2E 測試能穩定建立新借閱/新預約（不會一進去就撞 max_loans/max_holds）
     login_user_ids = {teacher_login_id, student_login_id}
 
+    # teachers + students 的姓名一次整批產生（T0001 已建立 → 其餘 teachers 共 cfg.teachers - 1 位）
+    n_bulk_teachers = max(0, cfg.teachers - 1)
+    bulk_names = text.person_name_batch(n_bulk_teachers + cfg.students)
+    teacher_names = bulk_names[:n_bulk_teachers]
+    student_names = bulk_names[n_bulk_teachers:]
+
+    # 處室/班級同樣整批抽（rng.choices(k=...)），迴圈內只剩 index
+    teacher_units = rng.choices(("教務處", "學務處", "總務處", "輔導室", "導師", "科任"), k=n_bulk_teachers)
+    # students：以「班級」分布（501~520）做 UI filter
+    class_codes = [f"{grade}{cls:02d}" for grade in [5, 6] for cls in range(1, 11)]
+    student_classes = rng.choices(class_codes, k=cfg.students)
+
     # 其餘 teachers：外觀/搜尋用，名稱全繁中
     for i in range(2, cfg.teachers + 1):
         ext = f"T{i:04d}"
-        name = text.person_name() + "老師"
-        unit = rng.choice(["教務處", "學務處", "總務處", "輔導室", "導師", "科任"])
-        add_user(ext, name, "teacher", unit, "active")
+        name = teacher_names[i - 2] + "老師"
+        add_user(ext, name, "teacher", teacher_units[i - 2], "active")
 
-    # students：以「班級」分布（501~520）做 UI filter
-    class_codes = [f"{grade}{cls:02d}" for grade in [5, 6] for cls in range(1, 11)]
     for i in range(1, cfg.students + 1):
         # 外部系統學號示意：S113 + 4 digits
         ext = f"S113{i:04d}"
-        name = text.person_name()
-        org_unit = rng.choice(class_codes)
+        name = student_names[i - 1]
+        org_unit = student_classes[i - 1]
         status = "inactive" if (i % 97 == 0) else "active"  # 少量停用，方便測 status filter
         # S1130123 我們已建立；避免重複
         if ext == "S1130123":
@@ -1256,22 +1802,21 @@ def main() -> None:
     # 3.4 user_credentials（只給少數帳號）
     # - 這裡用固定 salt/hash（可重現）→ 不用對每個人跑 scrypt（節省時間）
     # ----------------------------
-    credentials_rows = [
-        [admin_id, salt, password_hash, "scrypt-v1"],
-        [librarian_id, salt, password_hash, "scrypt-v1"],
-        [teacher_login_id, salt, password_hash, "scrypt-v1"],
-        [student_login_id, salt, password_hash, "scrypt-v1"],
-    ]
+    # - 可登入帳號共用同一組 salt/hash：hash 只算一次，再套用到每個帳號
+    credential_user_ids = [admin_id, librarian_id, teacher_login_id, student_login_id]
+    credentials_rows = [[user_id, salt, password_hash, "scrypt-v1"] for user_id in credential_user_ids]
 
     # ----------------------------
     # 3.5 bibliographic_records（書目）
     # - creators/subjects 用 text[]（用 pg_array）
     # ----------------------------
-    bibs: list[dict[str, str]] = []
+    bibs = BibColumns()
+    bib_uuid = uuid5_numbered_series(ns, f"{cfg.org_code}:bib:", 6)
     # bibliographic_subject_terms（authority linking v1）
     # - 讓你能用 term_id-driven 的方式查詢/統計（避免靠 subjects 的字串長相）
     # - position 用於保留原本 subjects 的順序（匯出/顯示會用到）
-    bib_subject_terms_rows: list[dict[str, str]] = []
+    # - junction rows 直接存「COPY 欄位順序」的 tuple（每本書目好幾列；tuple 比 dict 小很多，寫出時也不用再查 key）
+    bib_subject_terms_rows: list[tuple[str, str, str, str]] = []
     # Authority / Vocabulary v0：從書目的 creators/subjects 收斂出「可重現」的權威款目清單。
     #
     # 設計取捨（scale seed）：
@@ -1282,10 +1827,20 @@ def main() -> None:
     authority_geographic_terms: set[str] = set()
     authority_genre_terms: set[str] = set()
 
-    # bibliographic_name_terms / geographic_terms / genre_terms（term_id linking）
-    bib_name_terms_rows: list[dict[str, str]] = []
-    bib_geographic_terms_rows: list[dict[str, str]] = []
-    bib_genre_terms_rows: list[dict[str, str]] = []
+    # bibliographic_name_terms / geographic_terms / genre_terms（term_id linking；同樣是 COPY 欄位順序的 tuple）
+    bib_name_terms_rows: list[tuple[str, str, str, str, str]] = []
+    bib_geographic_terms_rows: list[tuple[str, str, str, str]] = []
+    bib_genre_terms_rows: list[tuple[str, str, str, str]] = []
+
+    # authority term 的 id = uuid5("{org}:authority:{kind}:{vocab}:{label}")
+    # - 同一個詞會被 junction rows、authority_terms、thesaurus relations 反覆用到（主題詞只有上百個，卻出現數千次）
+    # - 用 cache：每個 (kind, vocab, label) 只 hash 一次，其餘都是 dict 查表
+    # - 第一次 hash 也走 uuid5_series："{org}:authority:" 前綴只算一次（name terms 會隨書目量成長到數千個）
+    authority_term_uuid = uuid5_series(ns, f"{cfg.org_code}:authority:")
+
+    @functools.lru_cache(maxsize=None)
+    def authority_term_id(kind: str, vocab: str, label: str) -> str:
+        return authority_term_uuid(f"{kind}:{vocab}:{label}")
 
     # E2E/QA 的「哨兵書目」：提供穩定可搜尋的標題 + 穩定可驗證的狀態
     # - sentinel_available：預設維持 available（讓 checkout/place hold/checkin/fulfill 流程可預期）
@@ -1296,8 +1851,46 @@ def main() -> None:
     sentinel_bib_title = "【E2E】預約/借還流程測試書（請勿刪除）"
     sentinel_unavailable_bib_index = 2
     sentinel_unavailable_bib_title = "【E2E】全部借出（不可借）測試書（請勿刪除）"
+
+    # 一般書目的 marc_extras 只有「空」或「固定兩個 note」兩種 → JSON 只序列化一次，所有書目共用同一個字串
+    bulk_marc_extras_empty_json = jsonb([])
+    bulk_marc_extras_notes_json = jsonb(
+        [
+            marc_data_field("500", subfields=[("a", "含插圖，適合國小閱讀。")]),
+            marc_data_field(
+                "520",
+                subfields=[("a", "以案例帶領讀者理解主題核心概念。")],
+            ),
+        ]
+    )
+
+    # 一般書目的欄位亂數整批先抽（同 users 的 person_name_batch、items/loans 的 rng.choices）：
+    # - 陣列以「書目序號 - 1」索引；哨兵書目（前兩筆）的那幾格直接不用
+    # - subjects 也整批抽（subject_terms_batch：choices + 逐組去重、不足再補抽）；geographics/genres 多數書目為 0 個，仍逐筆 rng.sample
+    n_bibs_total = cfg.bibs
+    bulk_titles = text.bib_title_batch(n_bibs_total)
+    bulk_languages = text.language_code_batch(n_bibs_total)
+    bulk_publishers = text.publisher_batch(n_bibs_total)
+    bulk_classifications = text.classification_batch(n_bibs_total)
+    bulk_published_years = rng.choices([str(y) for y in range(1995, 2026)], k=n_bibs_total)
+    bulk_isbn_bodies = rng.choices(range(1000000000, 10000000000), k=n_bibs_total)
+    bulk_subjects = text.subject_terms_batch(rng.choices(range(1, 4), k=n_bibs_total))  # subjects：維持至少 1 個
+    # 其餘「每筆書目的小決策」都寫成 rng.choices + cum_weights（每個值只抽一次 random()，bisect 找落點）：
+    # - 取代逐筆 rand() 判斷 + rng.randrange（randrange 是好幾層 Python 呼叫）
+    # - 機率與原本的分支寫法相同（括號內是原本的寫法）
+    # geographics/genres 個數（35%/30% 有 → 1 或 2 個各半）
+    bulk_geographic_ks = rng.choices((0, 1, 2), cum_weights=(0.65, 0.825, 1.0), k=n_bibs_total)
+    bulk_genre_ks = rng.choices((0, 1, 2), cum_weights=(0.70, 0.85, 1.0), k=n_bibs_total)
+    bulk_has_marc_notes = rng.choices((True, False), cum_weights=(0.08, 1.0), k=n_bibs_total)
+    # 作者/貢獻者人數先決定，再一次 person_name_batch 抽出「總共需要的姓名數」，逐筆依序取用
+    # - creators：35% 兩位，其餘一位
+    # - contributors：(rand() < 0.55) + (rand() < 0.20) → 0/1/2 位 = 36% / 53% / 11%
+    bulk_n_creators = rng.choices((2, 1), cum_weights=(0.35, 1.0), k=n_bibs_total)
+    bulk_n_contributors = rng.choices((0, 1, 2), cum_weights=(0.36, 0.89, 1.0), k=n_bibs_total)
+    bulk_person_names = iter(text.person_name_batch(sum(bulk_n_creators) + sum(bulk_n_contributors)))
+
     for i in range(1, cfg.bibs + 1):
-        bib_id = uuid5(ns, f"{cfg.org_code}:bib:{i:06d}")
+        bib_id = bib_uuid(i)
         # 讓第一筆 bib 成為「哨兵」：標題可用關鍵字一搜就中，且有較完整的 MARC extras 例子。
         if i == sentinel_bib_index:
             title = sentinel_bib_title
@@ -1309,7 +1902,7 @@ def main() -> None:
             language = "zh-TW"
             publisher = "臺灣教育出版社"
             published_year = "2024"
-            isbn = "9780000000001"
+            isbn_body = 1  # → 9780000000001
             classification = "028.5"
 
             # marc_extras：放「表單未覆蓋」但實務常見的欄位，供你測試 editor/匯出 merge。
@@ -1334,6 +1927,7 @@ def main() -> None:
                     subfields=[("u", "https://example.com/e2e-sentinel"), ("y", "相關資源")],
                 ),
             ]
+            marc_extras_json = jsonb(marc_extras)
         elif i == sentinel_unavailable_bib_index:
             title = sentinel_unavailable_bib_title
             creators = ["測試作者丙"]
@@ -1344,63 +1938,38 @@ def main() -> None:
             language = "zh-TW"
             publisher = "臺灣教育出版社"
             published_year = "2023"
-            isbn = "9780000000002"
+            isbn_body = 2  # → 9780000000002
             classification = "028.6"
 
             # 這筆不需要放太多 MARC extras；重點是「狀態不可借」可被 available_only 正確排除。
             marc_extras = [marc_data_field("500", subfields=[("a", "本書目用於測試 available_only（不可借）。")])]
+            marc_extras_json = jsonb(marc_extras)
         else:
-            title = text.bib_title()
-
-            creators = [text.person_name()]
-            if rng.random() < 0.35:
-                creators.append(text.person_name())
+            k = i - 1  # 整批亂數的 index
+            title = bulk_titles[k]
 
+            creators = list(itertools.islice(bulk_person_names, bulk_n_creators[k]))
             # contributors：讓 700$a 有資料（也讓 bibliographic_name_terms 更像真實）
-            contributors: list[str] = []
-            if rng.random() < 0.55:
-                contributors.append(text.person_name())
-            if rng.random() < 0.20:
-                contributors.append(text.person_name())
+            contributors = list(itertools.islice(bulk_person_names, bulk_n_contributors[k]))
 
             # subjects：維持至少 1 個（讓 OPAC/後台的主題檢索更有感）
-            subjects = text.subject_terms(k=rng.randint(1, 3))
+            subjects = bulk_subjects[k]
 
             # geographics/genres：允許為空（更貼近真實館藏）
-            geographics = text.geographic_terms(k=(rng.randint(1, 2) if rng.random() < 0.35 else 0))
-            genres = text.genre_terms(k=(rng.randint(1, 2) if rng.random() < 0.30 else 0))
+            geographics = text.geographic_terms(k=bulk_geographic_ks[k])
+            genres = text.genre_terms(k=bulk_genre_ks[k])
 
-            language = text.language_code()
-            publisher = text.publisher()
-            published_year = str(rng.randint(1995, 2025))
-            isbn = f"978{rng.randint(1000000000, 9999999999)}"
-            classification = text.classification()
+            language = bulk_languages[k]
+            publisher = bulk_publishers[k]
+            published_year = bulk_published_years[k]
+            isbn_body = bulk_isbn_bodies[k]
+            classification = bulk_classifications[k]
 
             # marc_extras：大多數 bib 先留空（[]），少量放一些常見 note（讓 editor 有東西可看）
-            marc_extras = []
-            if rng.random() < 0.08:
-                marc_extras = [
-                    marc_data_field("500", subfields=[("a", "含插圖，適合國小閱讀。")]),
-                    marc_data_field(
-                        "520",
-                        subfields=[("a", "以案例帶領讀者理解主題核心概念。")],
-                    ),
-                ]
+            # - 只有這兩種內容 → 直接用迴圈外序列化好的 JSON 字串
+            marc_extras_json = bulk_marc_extras_notes_json if bulk_has_marc_notes[k] else bulk_marc_extras_empty_json
 
         # 去重（保序）：避免 junction table 因重複值造成 PK/position 衝突
-        def dedupe_keep_order(values: list[str]) -> list[str]:
-            seen: set[str] = set()
-            out: list[str] = []
-            for v in values:
-                s = str(v).strip()
-                if not s:
-                    continue
-                if s in seen:
-                    continue
-                seen.add(s)
-                out.append(s)
-            return out
-
         creators = dedupe_keep_order(creators)
         contributors = dedupe_keep_order(contributors)
         geographics = dedupe_keep_order(geographics)
@@ -1419,84 +1988,44 @@ def main() -> None:
 
         # authority linking（subjects）：
         # - term_id 與 authority_terms 的 UUID5 規則一致（可重現）
-        # - 這裡的 subjects 由 RulesTextProvider.sample 產生，不重複；仍用 position 保留順序
+        # - 這裡的 subjects 由 subject_terms_batch 產生（每組恰好 k 個不重複詞）；仍用 position 保留順序
         for pos, term in enumerate(subjects, start=1):
-            term_id = uuid5(ns, f"{cfg.org_code}:authority:subject:builtin-zh:{term}")
-            bib_subject_terms_rows.append(
-                {
-                    "organization_id": org_id,
-                    "bibliographic_id": bib_id,
-                    "term_id": term_id,
-                    "position": str(pos),
-                }
-            )
+            term_id = authority_term_id("subject", "builtin-zh", term)
+            bib_subject_terms_rows.append((org_id, bib_id, term_id, str(pos)))
 
         # authority linking（names）：
         # - role=creator：對應主作者/其他作者（MARC 100/700）
         # - role=contributor：對應貢獻者（MARC 700）
         for pos, name in enumerate(creators, start=1):
-            term_id = uuid5(ns, f"{cfg.org_code}:authority:name:local:{name}")
-            bib_name_terms_rows.append(
-                {
-                    "organization_id": org_id,
-                    "bibliographic_id": bib_id,
-                    "role": "creator",
-                    "term_id": term_id,
-                    "position": str(pos),
-                }
-            )
+            term_id = authority_term_id("name", "local", name)
+            bib_name_terms_rows.append((org_id, bib_id, "creator", term_id, str(pos)))
         for pos, name in enumerate(contributors, start=1):
-            term_id = uuid5(ns, f"{cfg.org_code}:authority:name:local:{name}")
-            bib_name_terms_rows.append(
-                {
-                    "organization_id": org_id,
-                    "bibliographic_id": bib_id,
-                    "role": "contributor",
-                    "term_id": term_id,
-                    "position": str(pos),
-                }
-            )
+            term_id = authority_term_id("name", "local", name)
+            bib_name_terms_rows.append((org_id, bib_id, "contributor", term_id, str(pos)))
 
         # authority linking（geographic / genre）：
         # - vocabulary_code：我們把 rules provider 的地名/體裁字庫視為 builtin-zh（可與 subject 一致）
         for pos, label in enumerate(geographics, start=1):
-            term_id = uuid5(ns, f"{cfg.org_code}:authority:geographic:builtin-zh:{label}")
-            bib_geographic_terms_rows.append(
-                {
-                    "organization_id": org_id,
-                    "bibliographic_id": bib_id,
-                    "term_id": term_id,
-                    "position": str(pos),
-                }
-            )
+            term_id = authority_term_id("geographic", "builtin-zh", label)
+            bib_geographic_terms_rows.append((org_id, bib_id, term_id, str(pos)))
         for pos, label in enumerate(genres, start=1):
-            term_id = uuid5(ns, f"{cfg.org_code}:authority:genre:builtin-zh:{label}")
-            bib_genre_terms_rows.append(
-                {
-                    "organization_id": org_id,
-                    "bibliographic_id": bib_id,
-                    "term_id": term_id,
-                    "position": str(pos),
-                }
-            )
+            term_id = authority_term_id("genre", "builtin-zh", label)
+            bib_genre_terms_rows.append((org_id, bib_id, term_id, str(pos)))
 
         bibs.append(
-            {
-                "id": bib_id,
-                "organization_id": org_id,
-                "title": title,
-                "creators": pg_array(creators),
-                "contributors": pg_array(contributors),
-                "publisher": publisher,
-                "published_year": published_year,
-                "language": language,
-                "subjects": pg_array(subjects),
-                "geographics": pg_array(geographics),
-                "genres": pg_array(genres),
-                "isbn": isbn,
-                "classification": classification,
-                "marc_extras": jsonb(marc_extras),
-            }
+            id=bib_id,
+            title=title,
+            creators=pg_array(creators),
+            contributors=pg_array(contributors),
+            publisher=publisher,
+            published_year=published_year,
+            language=language,
+            subjects=pg_array(subjects),
+            geographics=pg_array(geographics),
+            genres=pg_array(genres),
+            isbn_body=isbn_body,
+            classification=classification,
+            marc_extras=marc_extras_json,
         )
 
     # ----------------------------
@@ -1520,73 +2049,65 @@ def main() -> None:
     # - 由上面累積的 set 產生（可重現）
     # - v1.5 起：內建詞彙庫會帶少量 variant_labels（UF），讓搜尋/expand/治理可測
     # ----------------------------
-    authority_terms: list[dict[str, str]] = []
+    # 每列直接存「COPY 欄位順序」的 tuple（name terms 會隨書目量成長到數千筆；不必每列一個 dict）
+    # 欄位：id, organization_id, kind, vocabulary_code, preferred_label, variant_labels, note, source, status
+    authority_terms: list[tuple[str, ...]] = []
 
     for term in sorted(authority_subject_terms):
-        term_id = uuid5(ns, f"{cfg.org_code}:authority:subject:builtin-zh:{term}")
+        term_id = authority_term_id("subject", "builtin-zh", term)
         variants = RulesTextProvider._SUBJECT_VARIANTS.get(term)
         authority_terms.append(
-            {
-                "id": term_id,
-                "organization_id": org_id,
-                "kind": "subject",
-                "vocabulary_code": "builtin-zh",
-                "preferred_label": term,
-                "variant_labels": pg_array(variants) if variants else pg_null(),
-                "note": pg_null(),
-                "source": "seed-scale",
-                "status": "active",
-            }
+            (
+                term_id,
+                org_id,
+                "subject",
+                "builtin-zh",
+                term,
+                pg_array(variants) if variants else PG_NULL,
+                PG_NULL,
+                "seed-scale",
+                "active",
+            )
         )
 
     for term in sorted(authority_name_terms):
-        term_id = uuid5(ns, f"{cfg.org_code}:authority:name:local:{term}")
+        term_id = authority_term_id("name", "local", term)
         authority_terms.append(
-            {
-                "id": term_id,
-                "organization_id": org_id,
-                "kind": "name",
-                "vocabulary_code": "local",
-                "preferred_label": term,
-                "variant_labels": pg_null(),
-                "note": pg_null(),
-                "source": "seed-scale",
-                "status": "active",
-            }
+            (term_id, org_id, "name", "local", term, PG_NULL, PG_NULL, "seed-scale", "active")
         )
 
     for term in sorted(authority_geographic_terms):
-        term_id = uuid5(ns, f"{cfg.org_code}:authority:geographic:builtin-zh:{term}")
+        term_id = authority_term_id("geographic", "builtin-zh", term)
         variants = RulesTextProvider._GEOGRAPHIC_VARIANTS.get(term)
         authority_terms.append(
-            {
-                "id": term_id,
-                "organization_id": org_id,
-                "kind": "geographic",
-                "vocabulary_code": "builtin-zh",
-                "preferred_label": term,
-                "variant_labels": pg_array(variants) if variants else pg_null(),
-                "note": pg_null(),
-                "source": "seed-scale",
-                "status": "active",
-            }
+            (
+                term_id,
+                org_id,
+                "geographic",
+                "builtin-zh",
+                term,
+                pg_array(variants) if variants else PG_NULL,
+                PG_NULL,
+                "seed-scale",
+                "active",
+            )
         )
 
     for term in sorted(authority_genre_terms):
-        term_id = uuid5(ns, f"{cfg.org_code}:authority:genre:builtin-zh:{term}")
+        term_id = authority_term_id("genre", "builtin-zh", term)
         variants = RulesTextProvider._GENRE_VARIANTS.get(term)
         authority_terms.append(
-            {
-                "id": term_id,
-                "organization_id": org_id,
-                "kind": "genre",
-                "vocabulary_code": "builtin-zh",
-                "preferred_label": term,
-                "variant_labels": pg_array(variants) if variants else pg_null(),
-                "note": pg_null(),
-                "source": "seed-scale",
-                "status": "active",
-            }
+            (
+                term_id,
+                org_id,
+                "genre",
+                "builtin-zh",
+                term,
+                pg_array(variants) if variants else PG_NULL,
+                PG_NULL,
+                "seed-scale",
+                "active",
+            )
         )
 
     # ----------------------------
@@ -1594,8 +2115,10 @@ def main() -> None:
     # - 不是為了「語意正確」的分類法，而是為了讓 UI/檢索擴充功能有真資料可跑
     # - 僅建立少量 deterministic 關係（避免產生 cycle）
     # ----------------------------
-    authority_relations: list[dict[str, str]] = []
+    # 欄位：id, organization_id, from_term_id, relation_type, to_term_id（同 authority_terms，直接存 tuple）
+    authority_relations: list[tuple[str, str, str, str, str]] = []
     rel_keys: set[tuple[str, str, str]] = set()  # (from_term_id, relation_type, to_term_id)
+    relation_uuid = uuid5_series(ns, f"{cfg.org_code}:relation:")
 
     def try_add_broader(kind: str, vocab: str, narrower_label: str, broader_label: str) -> None:
         if not narrower_label or not broader_label:
@@ -1614,20 +2137,14 @@ def main() -> None:
             if narrower_label not in authority_genre_terms or broader_label not in authority_genre_terms:
                 return
 
-        from_id = uuid5(ns, f"{cfg.org_code}:authority:{kind}:{vocab}:{narrower_label}")
-        to_id = uuid5(ns, f"{cfg.org_code}:authority:{kind}:{vocab}:{broader_label}")
+        from_id = authority_term_id(kind, vocab, narrower_label)
+        to_id = authority_term_id(kind, vocab, broader_label)
         key = (from_id, "broader", to_id)
         if key in rel_keys:
             return
         rel_keys.add(key)
         authority_relations.append(
-            {
-                "id": uuid5(ns, f"{cfg.org_code}:relation:{from_id}:broader:{to_id}"),
-                "organization_id": org_id,
-                "from_term_id": from_id,
-                "relation_type": "broader",
-                "to_term_id": to_id,
-            }
+            (relation_uuid(f"{from_id}:broader:{to_id}"), org_id, from_id, "broader", to_id)
         )
 
     def try_add_related(kind: str, vocab: str, a_label: str, b_label: str) -> None:
@@ -1647,8 +2164,8 @@ def main() -> None:
             if a_label not in authority_genre_terms or b_label not in authority_genre_terms:
                 return
 
-        a_id = uuid5(ns, f"{cfg.org_code}:authority:{kind}:{vocab}:{a_label}")
-        b_id = uuid5(ns, f"{cfg.org_code}:authority:{kind}:{vocab}:{b_label}")
+        a_id = authority_term_id(kind, vocab, a_label)
+        b_id = authority_term_id(kind, vocab, b_label)
         # related：存一筆即可（固定排序避免 A↔B 兩筆）
         from_id, to_id = (a_id, b_id) if a_id < b_id else (b_id, a_id)
         key = (from_id, "related", to_id)
@@ -1656,13 +2173,7 @@ def main() -> None:
             return
         rel_keys.add(key)
         authority_relations.append(
-            {
-                "id": uuid5(ns, f"{cfg.org_code}:relation:{from_id}:related:{to_id}"),
-                "organization_id": org_id,
-                "from_term_id": from_id,
-                "relation_type": "related",
-                "to_term_id": to_id,
-            }
+            (relation_uuid(f"{from_id}:related:{to_id}"), org_id, from_id, "related", to_id)
         )
 
     # subjects：BT/RT（由 rules provider 的 deterministic edges 產生）
@@ -1689,7 +2200,8 @@ def main() -> None:
     # - location 分布：MAIN 60% / BRANCH 25% / CLASSROOM 10% / STORAGE 5%
     # - status 先全部 available，之後再分配 checked_out / on_hold / lost / repair / withdrawn
     # ----------------------------
-    items: list[dict[str, str]] = []
+    items = ItemColumns()
+    item_uuid = uuid5_numbered_series(ns, f"{cfg.org_code}:item:", 8)
     barcode_counter = 1
 
     # E2E 哨兵冊資訊（用於後續「避開隨機分配」與輸出提示）
@@ -1698,62 +2210,63 @@ def main() -> None:
     sentinel_unavailable_item_index = None
     sentinel_unavailable_item_barcode = None
 
-    def pick_location_id() -> str:
-        x = rng.random()
-        if x < 0.60:
-            return loc_main
-        if x < 0.85:
-            return loc_branch
-        if x < 0.95:
-            return loc_classroom
-        return loc_storage
-
-    for i, bib in enumerate(bibs, start=1):
-        # E2E 哨兵書目：固定只有 1 冊
-        # - sentinel_available：讓「checkout → place hold → checkin → fulfill」可完全可預期
-        # - sentinel_unavailable：讓 available_only filter 有穩定的「應被排除」案例
-        copies = (
-            1
-            if i in (sentinel_bib_index, sentinel_unavailable_bib_index)
-            else rng.randint(1, cfg.max_copies_per_bib)
-        )
+    # 欄位亂數「整批抽」（column-wise），迴圈內只剩索引：
+    # - 原本每冊要呼叫 randint/random 好幾次（每次都是一串 Python frame：randint → randrange → _randbelow）
+    # - 改成每個欄位一次 rng.choices(k=N)：分布不變，但把 N 次函式呼叫攤平成一個 C 迴圈為主的批次
+    # - 仍然只用同一個 rng（固定 seed → 固定抽樣順序），可重現性不受影響
+    #
+    # E2E 哨兵書目：固定只有 1 冊
+    # - sentinel_available：讓「checkout → place hold → checkin → fulfill」可完全可預期
+    # - sentinel_unavailable：讓 available_only filter 有穩定的「應被排除」案例
+    copies_per_bib = rng.choices(range(1, cfg.max_copies_per_bib + 1), k=len(bibs))
+    for sentinel_index in (sentinel_bib_index, sentinel_unavailable_bib_index):
+        if sentinel_index <= len(copies_per_bib):
+            copies_per_bib[sentinel_index - 1] = 1
+    n_items_total = sum(copies_per_bib)
+
+    # location 分布用 cum_weights 表達（MAIN 60% / BRANCH 25% / CLASSROOM 10% / STORAGE 5%）
+    item_location_buckets = (loc_main, loc_branch, loc_classroom, loc_storage)
+    item_location_ids = rng.choices(
+        item_location_buckets,
+        cum_weights=[0.60, 0.85, 0.95, 1.00],
+        k=n_items_total,
+    )
+    item_acquired_days = rng.choices(range(0, 3651), k=n_items_total)
+    # last_inventory_at：先給少量冊有值（讓 UI 能顯示「曾盤點過」）
+    item_has_last_inv = [rng.random() < 0.10 for _ in range(n_items_total)]
+    item_last_inv_days = rng.choices(range(1, 366), k=n_items_total)
+
+    for i, bib_id in enumerate(bibs.id, start=1):
+        copies = copies_per_bib[i - 1]
         for c in range(1, copies + 1):
-            item_id = uuid5(ns, f"{cfg.org_code}:item:{barcode_counter:08d}")
+            k = len(items)  # 本冊在 items 的 index（也是上面整批亂數的 index）
+            item_id = item_uuid(barcode_counter)
             barcode = f"SCL-{barcode_counter:08d}"
             barcode_counter += 1
 
-            classification = bib["classification"]
-            call_number = f"{classification} {i:04d}-{c}"
             # 哨兵冊固定放 MAIN（避免被隨機分到 CLASSROOM/STORAGE 造成取書點/工作台測試不穩）
             location_id = (
                 loc_main
                 if i in (sentinel_bib_index, sentinel_unavailable_bib_index)
-                else pick_location_id()
+                else item_location_ids[k]
             )
 
-            acquired_at = now_utc() - dt.timedelta(days=rng.randint(0, 3650))
-
-            # last_inventory_at：先給少量冊有值（讓 UI 能顯示「曾盤點過」）
-            last_inv = None
-            if rng.random() < 0.10:
-                last_inv = now_utc() - dt.timedelta(days=rng.randint(1, 365))
+            acquired_at = iso_days_from_now(-item_acquired_days[k])
+            last_inv = iso_days_from_now(-item_last_inv_days[k]) if item_has_last_inv[k] else PG_NULL
 
             items.append(
-                {
-                    "id": item_id,
-                    "organization_id": org_id,
-                    "bibliographic_id": bib["id"],
-                    "barcode": barcode,
-                    "call_number": call_number,
-                    "location_id": location_id,
-                    "status": "available",
-                    "acquired_at": iso(acquired_at),
-                    "last_inventory_at": iso(last_inv),
-                    "notes": pg_null(),
-                }
+                id=item_id,
+                bibliographic_id=bib_id,
+                barcode=barcode,
+                bib_no=i,
+                copy_no=c,
+                location_id=location_id,
+                status="available",
+                acquired_at=acquired_at,
+                last_inventory_at=last_inv,
             )
 
-            # 記錄哨兵冊的位置（items list index / barcode）
+            # 記錄哨兵冊的位置（items 的 index / barcode）
             if i == sentinel_bib_index and c == 1:
                 sentinel_available_item_index = len(items) - 1
                 sentinel_available_item_barcode = barcode
@@ -1767,13 +2280,12 @@ def main() -> None:
     # - on_hold：一定會有 ready hold + assigned_item_id
     # - lost/repair/withdrawn：用於 UI 狀態篩選
     # ----------------------------
-    item_ids_all = [it["id"] for it in items]
-    if cfg.open_loans > len(item_ids_all):
+    if cfg.open_loans > len(items):
         raise SystemExit(
-            f"[seed-scale] SCALE_OPEN_LOANS too large; items={len(item_ids_all)} open_loans={cfg.open_loans}"
+            f"[seed-scale] SCALE_OPEN_LOANS too large; items={len(items)} open_loans={cfg.open_loans}"
         )
 
-    # 我們用 index 取樣，比直接 sample dict 更快。
+    # 我們用 index 取樣（items 是欄位式，index 就是「第幾冊」）。
     #
     # 但要先保留「E2E 哨兵冊」不被隨機分配成 checked_out/on_hold：
     # - sentinel_available：必須維持 available（讓流程測試穩定）
@@ -1787,42 +2299,55 @@ def main() -> None:
     forced_checked_out_indexes: set[int] = set()
     if sentinel_unavailable_item_index is not None:
         forced_checked_out_indexes.add(int(sentinel_unavailable_item_index))
-    idx_all = [i for i in range(len(items)) if i not in sentinel_item_indexes]
-    rng.shuffle(idx_all)
+    # 候選冊 = 全部 index 扣掉哨兵冊（最多 2 個）：list(range) 在 C 層建好，再由大到小刪掉哨兵位置
+    # （不必每冊做一次 set 查詢；順序與逐一 filter 相同）
+    candidate_idx = list(range(len(items)))
+    for i in sorted(sentinel_item_indexes, reverse=True):
+        del candidate_idx[i]
 
     # 小比例異常狀態（總共約 2%）
     n_lost = max(5, len(items) // 200)  # 0.5%
     n_repair = max(5, len(items) // 200)  # 0.5%
     n_withdrawn = max(5, len(items) // 500)  # 0.2%
 
-    lost_idx = set(idx_all[:n_lost])
-    repair_idx = set(idx_all[n_lost : n_lost + n_repair])
-    withdrawn_idx = set(idx_all[n_lost + n_repair : n_lost + n_repair + n_withdrawn])
-
-    remaining = [i for i in idx_all if i not in lost_idx and i not in repair_idx and i not in withdrawn_idx]
-
     # open loans：除了隨機取樣外，還要保留「強制 checked_out」的哨兵冊名額
     open_loan_target = max(0, cfg.open_loans - len(forced_checked_out_indexes))
-    open_loan_idx = set(remaining[:open_loan_target])
-    remaining2 = [i for i in remaining if i not in open_loan_idx]
-
-    ready_hold_idx = set(remaining2[: cfg.ready_holds])
-
-    for i, it in enumerate(items):
-        if i in lost_idx:
-            it["status"] = "lost"
-        elif i in repair_idx:
-            it["status"] = "repair"
-        elif i in withdrawn_idx:
-            it["status"] = "withdrawn"
-        elif i in open_loan_idx:
-            it["status"] = "checked_out"
-        elif i in ready_hold_idx:
-            it["status"] = "on_hold"
+
+    # 只需要「前 n_assigned 個」隨機冊：用 rng.sample 做部分洗牌即可
+    # - 以前 rng.shuffle 整個 candidate list（每冊一次 Python 層 swap），但 available 的那一大段其實不會被用到
+    # - sample(k) 的結果就是「隨機排列的前 k 個」，分布與 shuffle 後取前 k 個相同
+    n_assigned = n_lost + n_repair + n_withdrawn + open_loan_target + cfg.ready_holds
+    idx_all = rng.sample(candidate_idx, k=min(n_assigned, len(candidate_idx)))
+
+    # idx_all 已隨機且不含哨兵冊 → 各 bucket 直接取「相鄰的一段 slice」就彼此不重疊：
+    #   [lost | repair | withdrawn | checked_out(open loans) | on_hold(ready holds) | 其餘 available]
+    # 不需要先建 set、再用 set 過濾出 remaining/remaining2 清單（那是多跑好幾趟 O(N)）
+    # 預設 status 已是 available；只寫「會改狀態」的冊（被分配的冊數遠小於 len(items)）
+    #
+    # 同時記下「每個非 available 狀態有哪些冊」（item_indexes_by_status）：
+    # - 後面 loans（checked_out）/ ready holds（on_hold）直接拿來用，不必再掃一次全部 items.status
+    # - index 排成遞增 → 與「依 items 順序 filter」得到的順序相同
+    item_indexes_by_status: dict[str, list[int]] = {}
+    offset = 0
+    for size, status in (
+        (n_lost, "lost"),
+        (n_repair, "repair"),
+        (n_withdrawn, "withdrawn"),
+        (open_loan_target, "checked_out"),
+        (cfg.ready_holds, "on_hold"),
+    ):
+        bucket = idx_all[offset : offset + size]
+        for i in bucket:
+            items.status[i] = status
+        item_indexes_by_status[status] = sorted(bucket)
+        offset += size
 
     # 手動套用哨兵冊狀態（確保可預期）
     for i in forced_checked_out_indexes:
-        items[i]["status"] = "checked_out"
+        items.status[i] = "checked_out"
+    item_indexes_by_status["checked_out"] = sorted(
+        item_indexes_by_status["checked_out"] + list(forced_checked_out_indexes)
+    )
 
     # ----------------------------
     # 3.8 circulation_policies（學生/教師）
@@ -1865,70 +2390,101 @@ def main() -> None:
     # - open loans：對應 checked_out items（returned_at=NULL）
     # - closed loans：歷史資料（returned_at 非 NULL）
     # ----------------------------
+    # borrowers 存 users 的 index（users 是 SoA；用 index 同時取 id/role）
     borrowers_active = [
-        u for u in users if u["role"] in ("student", "teacher") and u["status"] == "active"
+        i
+        for i, (role, status) in enumerate(zip(users.role, users.status))
+        if role in ("student", "teacher") and status == "active"
     ]
     if not borrowers_active:
         raise SystemExit("[seed-scale] no active borrowers; check SCALE_STUDENTS/SCALE_TEACHERS")
 
     # bulk 分配用 borrowers：避免把 login accounts 撐爆（讓 E2E 更穩）
-    borrowers_bulk = [u for u in borrowers_active if u["id"] not in login_user_ids]
+    borrowers_bulk = [i for i in borrowers_active if users.id[i] not in login_user_ids]
     if not borrowers_bulk:
         borrowers_bulk = borrowers_active
 
-    items_checked_out = [it for it in items if it["status"] == "checked_out"]
+    items_checked_out = [items.id[i] for i in item_indexes_by_status["checked_out"]]
+
+    # 借期（天）直接取自上面 seed 的 circulation_policies（audience_role → loan_days）：
+    # - 迴圈內只剩一次 dict 查詢，不再每列比對角色字串 + 寫死 28/14
+    # - 政策的 loan_days 若調整，loans 的 due_at 會自動跟著一致
+    loan_days_by_role = {p["audience_role"]: int(p["loan_days"]) for p in policies}
+
+    # loans/holds 的亂數同樣「整批抽」（與 3.6 items 相同手法）：
+    # - 每個欄位一次 rng.choices(k=N)（或 N 次 rng.random 的 C 呼叫），迴圈內只剩索引
+    # - 避免每列好幾次 rng.choice/randint（randint 每次都要走好幾層 Python frame）
+    # - 仍只用同一個 rng → 固定 seed 仍得到固定資料
 
     # open loans：一冊一筆（符合 loans_one_open_per_item）
-    loans: list[dict[str, str]] = []
-    for it in items_checked_out:
-        loan_id = uuid5(ns, f"{cfg.org_code}:loan:open:{it['id']}")
-        borrower = rng.choice(borrowers_bulk)
-        checked_out_at = now_utc() - dt.timedelta(days=rng.randint(0, 60))
-        loan_days = 28 if borrower["role"] == "teacher" else 14
-        due_at = checked_out_at + dt.timedelta(days=loan_days)
-
-        # 少量做成逾期（讓 Overdue Report 一進去就有資料）
-        if rng.random() < 0.15:
-            due_at = now_utc() - dt.timedelta(days=rng.randint(1, 20))
+    loans = LoanColumns()
+    open_loan_uuid = uuid5_series(ns, f"{cfg.org_code}:loan:open:")
+    closed_loan_uuid = uuid5_numbered_series(ns, f"{cfg.org_code}:loan:closed:", 7)
+    n_open = len(items_checked_out)
+    open_borrowers = rng.choices(borrowers_bulk, k=n_open)
+    # 時間都以「距今天數」表示（負數＝過去），最後才查表轉成 ISO 字串
+    open_checked_out_days = rng.choices(range(0, 61), k=n_open)
+    # 少量做成逾期（讓 Overdue Report 一進去就有資料）：逾期天數整批先抽，只有被標成逾期的列會用到
+    open_is_overdue = [rand() < 0.15 for _ in range(n_open)]
+    open_overdue_days = rng.choices(range(1, 21), k=n_open)
+    open_renewed = rng.choices(("0", "1"), k=n_open)
+
+    for k, item_id in enumerate(items_checked_out):
+        loan_id = open_loan_uuid(item_id)
+        borrower = open_borrowers[k]
+        checked_out_day = -open_checked_out_days[k]
+        loan_days = loan_days_by_role[users.role[borrower]]
+        due_day = -open_overdue_days[k] if open_is_overdue[k] else checked_out_day + loan_days
 
         loans.append(
-            {
-                "id": loan_id,
-                "organization_id": org_id,
-                "item_id": it["id"],
-                "user_id": borrower["id"],
-                "checked_out_at": iso(checked_out_at),
-                "due_at": iso(due_at),
-                "returned_at": pg_null(),
-                "renewed_count": str(rng.randint(0, 1)),
-                "status": "open",
-            }
+            id=loan_id,
+            item_id=item_id,
+            user_id=users.id[borrower],
+            checked_out_at=iso_days_from_now(checked_out_day),
+            due_at=iso_days_from_now(due_day),
+            returned_at=PG_NULL,
+            renewed_count=open_renewed[k],
+            status="open",
         )
 
     # closed loans：大量歷史（用來測 reports/top-circulation / circulation-summary）
-    for i in range(1, cfg.closed_loans + 1):
-        loan_id = uuid5(ns, f"{cfg.org_code}:loan:closed:{i:07d}")
-        borrower = rng.choice(borrowers_bulk)
-        item = rng.choice(items)
-
-        checked_out_at = now_utc() - dt.timedelta(days=rng.randint(0, 365))
-        loan_days = 28 if borrower["role"] == "teacher" else 14
-        due_at = checked_out_at + dt.timedelta(days=loan_days)
-        returned_at = checked_out_at + dt.timedelta(days=rng.randint(1, loan_days))
+    n_closed = cfg.closed_loans
+    closed_borrowers = rng.choices(borrowers_bulk, k=n_closed)
+    closed_item_ids = rng.choices(items.id, k=n_closed)
+    closed_checked_out_days = rng.choices(range(0, 366), k=n_closed)
+    # returned_at：借出後 1..loan_days 天歸還（loan_days 依角色不同 → 先抽 [0,1) 再依 loan_days 換算）
+    closed_return_fracs = [rand() for _ in range(n_closed)]
+    closed_renewed = rng.choices(("0", "1", "2"), k=n_closed)
+
+    # closed loans 列數最多、每個欄位又都能各自算完 → 逐欄一次組好（長度皆為 n_closed），最後 loans.extend 一次
+    # （逐列 append 的寫法：每列一次 keyword 呼叫 + 8 次 list.append；結果逐位元相同）
+    closed_loan_days = [loan_days_by_role[users.role[b]] for b in closed_borrowers]
+    loans.extend(
+        id=list(map(closed_loan_uuid, range(1, n_closed + 1))),
+        item_id=closed_item_ids,
+        user_id=[users.id[b] for b in closed_borrowers],
+        checked_out_at=[iso_days_from_now(-d) for d in closed_checked_out_days],
+        due_at=[iso_days_from_now(ld - d) for d, ld in zip(closed_checked_out_days, closed_loan_days)],
+        # returned_at：借出後 1..loan_days 天歸還
+        returned_at=[
+            iso_days_from_now(1 - d + int(frac * ld))
+            for d, frac, ld in zip(closed_checked_out_days, closed_return_fracs, closed_loan_days)
+        ],
+        renewed_count=closed_renewed,
+        status=["closed"] * n_closed,
+    )
 
-        loans.append(
-            {
-                "id": loan_id,
-                "organization_id": org_id,
-                "item_id": item["id"],
-                "user_id": borrower["id"],
-                "checked_out_at": iso(checked_out_at),
-                "due_at": iso(due_at),
-                "returned_at": iso(returned_at),
-                "renewed_count": str(rng.randint(0, 2)),
-                "status": "closed",
-            }
-        )
+    # ----------------------------
+    # 3.10 ~ 3.12：holds / inventory_scans / audit_events（邊寫 COPY 邊產生）
+    # ----------------------------
+    # 這三張表「寫出去之後就不會再被讀」（audit 只需要 holds/scans 的 id），所以不先組成 dict list 再轉一次：
+    # - 每張表是一個 generator，直接 yield「COPY 欄位順序」的 tuple，由 write_load_script 逐列寫進 psql
+    # - 記憶體只保留後面會被引用的 id（hold_ids / inventory_scan_ids），不保留整列
+    #
+    # 注意（可重現性）：這些 generator 的亂數是在「被 write_load_script 消費時」才抽
+    # - 消費順序固定為 holds → inventory_scans → audit_events（也就是 COPY 的 FK 順序）→ 抽樣順序仍固定
+    # - audit 會從 hold_ids / inventory_scan_ids 抽 entity_id → 必須排在它們之後消費（COPY 順序本來就是如此）
+    # - 每個 generator 只能被消費一次（write_load_script 只會被呼叫一次）
 
     # ----------------------------
     # 3.10 holds（queued + ready）
@@ -1936,76 +2492,95 @@ def main() -> None:
     # - ready：assigned_item_id 指向 on_hold item
     # - 需避免 holds_one_active_per_user_bib（同 user+bib 不能同時有 queued/ready）
     # ----------------------------
-    holds: list[dict[str, str]] = []
-    active_hold_keys: set[tuple[str, str]] = set()  # (user_id, bib_id)
-
-    # ready holds：以 on_hold items 為主（讓 Ready Holds Report 有資料）
-    ready_items = [it for it in items if it["status"] == "on_hold"]
-    for it in ready_items:
-        bib_id = it["bibliographic_id"]
-        user = rng.choice(borrowers_bulk)
-        key = (user["id"], bib_id)
-        if key in active_hold_keys:
-            continue
-        active_hold_keys.add(key)
-
-        hold_id = uuid5(ns, f"{cfg.org_code}:hold:ready:{it['id']}")
-        ready_at = now_utc() - dt.timedelta(days=rng.randint(0, 10))
+    hold_ids: list[str] = []
+    ready_hold_uuid = uuid5_series(ns, f"{cfg.org_code}:hold:ready:")
+    queued_hold_uuid = uuid5_numbered_series(ns, f"{cfg.org_code}:hold:queued:", 7)
+
+    def iter_hold_rows() -> Iterator[tuple[str, ...]]:
+        # 「同 user+bib 只能有一筆 active hold」的檢查 key：用 index 組成單一 int，而不是 (user_id, bib_id) 字串 tuple
+        # - key = user 的 index × (書目數 + 1) + 書目序號（bib_no，1-based）→ 一對一，不會撞
+        # - set 裡只放小 int：hash 不用碰兩個 36 字元 UUID 字串，也不用每次建 tuple
+        bib_key_stride = len(bibs) + 1
+        active_hold_keys: set[int] = set()
+
+        # ready holds：以 on_hold items 為主（讓 Ready Holds Report 有資料）
+        ready_items = item_indexes_by_status["on_hold"]
+        n_ready = len(ready_items)
+        ready_users = rng.choices(borrowers_bulk, k=n_ready)
+        ready_days = rng.choices(range(0, 11), k=n_ready)
         # 部分做成「已過期的 ready」（可測 expire-ready maintenance）
-        if rng.random() < 0.25:
-            ready_until = now_utc() - dt.timedelta(days=rng.randint(1, 7))
-        else:
-            ready_until = now_utc() + dt.timedelta(days=rng.randint(1, 7))
-
-        holds.append(
-            {
-                "id": hold_id,
-                "organization_id": org_id,
-                "bibliographic_id": bib_id,
-                "user_id": user["id"],
-                "pickup_location_id": it["location_id"],
-                "placed_at": iso(ready_at - dt.timedelta(days=rng.randint(0, 3))),
-                "status": "ready",
-                "assigned_item_id": it["id"],
-                "ready_at": iso(ready_at),
-                "ready_until": iso(ready_until),
-                "cancelled_at": pg_null(),
-                "fulfilled_at": pg_null(),
-            }
-        )
-
-    # queued holds：隨機書目（不指派冊）
-    # queued holds：避免把哨兵書目排隊（讓 E2E 能穩定 place hold）
-    sentinel_bib_id = uuid5(ns, f"{cfg.org_code}:bib:{sentinel_bib_index:06d}")
-    bib_ids = [b["id"] for b in bibs if b["id"] != sentinel_bib_id]
-    for i in range(1, cfg.queued_holds + 1):
-        hold_id = uuid5(ns, f"{cfg.org_code}:hold:queued:{i:07d}")
-        bib_id = rng.choice(bib_ids)
-        user = rng.choice(borrowers_bulk)
-        key = (user["id"], bib_id)
-        if key in active_hold_keys:
-            continue
-        active_hold_keys.add(key)
+        ready_is_expired = [rand() < 0.25 for _ in range(n_ready)]
+        ready_until_days = rng.choices(range(1, 8), k=n_ready)
+        ready_placed_before = rng.choices(range(0, 4), k=n_ready)
 
-        placed_at = now_utc() - dt.timedelta(days=rng.randint(0, 30))
-        pickup_location_id = rng.choice([loc_main, loc_branch, loc_classroom])
+        for k, i in enumerate(ready_items):
+            key = ready_users[k] * bib_key_stride + items.bib_no[i]
+            if key in active_hold_keys:
+                continue
+            active_hold_keys.add(key)
+            item_id = items.id[i]
+            bib_id = items.bibliographic_id[i]
+            user_id = users.id[ready_users[k]]
+
+            hold_id = ready_hold_uuid(item_id)
+            ready_day = -ready_days[k]
+            ready_until_day = -ready_until_days[k] if ready_is_expired[k] else ready_until_days[k]
+
+            hold_ids.append(hold_id)
+            # 欄位：id, organization_id, bibliographic_id, user_id, pickup_location_id, placed_at, status,
+            #       assigned_item_id, ready_at, ready_until, cancelled_at, fulfilled_at
+            yield (
+                hold_id,
+                org_id,
+                bib_id,
+                user_id,
+                items.location_id[i],
+                iso_days_from_now(ready_day - ready_placed_before[k]),
+                "ready",
+                item_id,
+                iso_days_from_now(ready_day),
+                iso_days_from_now(ready_until_day),
+                PG_NULL,
+                PG_NULL,
+            )
 
-        holds.append(
-            {
-                "id": hold_id,
-                "organization_id": org_id,
-                "bibliographic_id": bib_id,
-                "user_id": user["id"],
-                "pickup_location_id": pickup_location_id,
-                "placed_at": iso(placed_at),
-                "status": "queued",
-                "assigned_item_id": pg_null(),
-                "ready_at": pg_null(),
-                "ready_until": pg_null(),
-                "cancelled_at": pg_null(),
-                "fulfilled_at": pg_null(),
-            }
-        )
+        # queued holds：隨機書目（不指派冊）；避免把哨兵書目排隊（讓 E2E 能穩定 place hold）
+        bib_nos = [n for n in range(1, len(bibs) + 1) if n != sentinel_bib_index]
+        bib_ids = [bibs.id[n - 1] for n in bib_nos]
+        # (user, bib) 組合直接「不重複抽樣」：把 borrowers_bulk × bib_ids 攤平成 0..U*B-1，
+        # 用 rng.sample(range(...)) 抽 k 個不同的 index（range 不會真的展開成 list）
+        # → queued holds 彼此一定不重複；只剩「剛好撞到 ready hold」需要跳過（ready 只有少量）
+        n_bibs = len(bib_ids)
+        n_pairs = len(borrowers_bulk) * n_bibs
+        n_queued = min(cfg.queued_holds, n_pairs)
+        queued_pairs = rng.sample(range(n_pairs), k=n_queued)
+        queued_placed_days = rng.choices(range(0, 31), k=n_queued)
+        queued_pickup_ids = rng.choices((loc_main, loc_branch, loc_classroom), k=n_queued)
+
+        for k in range(n_queued):
+            hold_id = queued_hold_uuid(k + 1)
+            user_index, bib_index = divmod(queued_pairs[k], n_bibs)
+            borrower = borrowers_bulk[user_index]
+            if borrower * bib_key_stride + bib_nos[bib_index] in active_hold_keys:
+                continue
+            bib_id = bib_ids[bib_index]
+            user_id = users.id[borrower]
+
+            hold_ids.append(hold_id)
+            yield (
+                hold_id,
+                org_id,
+                bib_id,
+                user_id,
+                queued_pickup_ids[k],
+                iso_days_from_now(-queued_placed_days[k]),
+                "queued",
+                PG_NULL,
+                PG_NULL,
+                PG_NULL,
+                PG_NULL,
+                PG_NULL,
+            )
 
     # ----------------------------
     # 3.11 inventory_sessions / inventory_scans（至少 1 個 closed session）
@@ -2014,69 +2589,84 @@ def main() -> None:
     #   - 只掃一部分 → missing
     #   - 掃到非 available 或不同 location 的 item → unexpected
     # ----------------------------
-    inventory_sessions_rows: list[dict[str, str]] = []
-    inventory_scans_rows: list[dict[str, str]] = []
+    # sessions 只有幾筆：直接建好（scans generator 也要用到 session 的 id/location/started_at）
+    inventory_sessions_rows: list[tuple[str, ...]] = []
+    inventory_session_plans: list[tuple[str, str, dt.datetime]] = []  # (session_id, location_id, started_at)
 
     # 先做一個 MAIN 的 closed session（報表最常用）
-    base_started = now_utc() - dt.timedelta(days=30)
+    base_started = now - dt.timedelta(days=30)
     for s in range(1, max(1, cfg.inventory_sessions) + 1):
         session_id = uuid5(ns, f"{cfg.org_code}:inv_session:{s:03d}")
         location_id = loc_main if s == 1 else rng.choice([loc_main, loc_branch, loc_classroom])
         started_at = base_started + dt.timedelta(days=s)
-        closed_at = started_at + dt.timedelta(hours=2) if s <= 1 else pg_null()
+        closed_at = iso(started_at + dt.timedelta(hours=2)) if s <= 1 else PG_NULL
 
+        # 欄位：id, organization_id, location_id, actor_user_id, note, started_at, closed_at
         inventory_sessions_rows.append(
-            {
-                "id": session_id,
-                "organization_id": org_id,
-                "location_id": location_id,
-                "actor_user_id": librarian_id,
-                "note": f"大型資料集盤點（session {s}）",
-                "started_at": iso(started_at),
-                "closed_at": closed_at if isinstance(closed_at, str) else iso(closed_at),
-            }
+            (session_id, org_id, location_id, librarian_id, f"大型資料集盤點（session {s}）", iso(started_at), closed_at)
         )
+        inventory_session_plans.append((session_id, location_id, started_at))
+
+    inventory_scan_ids: list[str] = []
+    scan_uuid = uuid5_series(ns, f"{cfg.org_code}:inv_scan:")
+
+    def iter_inventory_scan_rows() -> Iterator[tuple[str, ...]]:
+        # 先掃 items 一次，依 location（以及 location + available）建 index list；
+        # 之後每個 session 只查 dict，不再對全部 items 重掃好幾遍
+        # （list 內的 index 都是遞增的 → 與「逐一 filter」得到的順序相同，sample 結果也相同）
+        n_items = len(items)
+        items_by_loc: dict[str, list[int]] = {}
+        available_by_loc: dict[str, list[int]] = {}
+        for i, (status, loc) in enumerate(zip(items.status, items.location_id)):
+            items_by_loc.setdefault(loc, []).append(i)
+            if status == "available":
+                available_by_loc.setdefault(loc, []).append(i)
+
+        # scanned_at = started_at + idx 分鐘：timedelta 只建一次，迴圈內用「乘整數」（C 快速路徑），
+        # 不必每列用 keyword 參數重建 timedelta
+        one_minute = dt.timedelta(minutes=1)
+
+        for session_id, location_id, started_at in inventory_session_plans:
+            # scans：只掃一部分（讓 missing 出現）
+            # （以 items 的 index 表示；sample 抽到的位置與「直接抽 item」相同）
+            if location_id not in items_by_loc:
+                continue
 
-        # scans：只掃一部分（讓 missing 出現）
-        items_in_loc = [it for it in items if it["location_id"] == location_id]
-        if not items_in_loc:
-            continue
+            scan_targets: list[int] = []
+            available_in_loc = available_by_loc.get(location_id, [])
+            scan_targets.extend(rng.sample(available_in_loc, k=min(len(available_in_loc), cfg.scans_per_session)))
+
+            # 加一些 unexpected：從其他 location 或非 available 狀態抽
+            # = 全部 items 扣掉 available_in_loc → 用 range 補上「兩個 available index 之間」的空隙
+            unexpected_pool: list[int] = []
+            prev = 0
+            for i in available_in_loc:
+                unexpected_pool.extend(range(prev, i))
+                prev = i + 1
+            unexpected_pool.extend(range(prev, n_items))
+            scan_targets.extend(
+                rng.sample(unexpected_pool, k=min(len(unexpected_pool), max(10, cfg.scans_per_session // 10)))
+            )
 
-        scan_targets: list[dict[str, str]] = []
-        available_in_loc = [it for it in items_in_loc if it["status"] == "available"]
-        scan_targets.extend(rng.sample(available_in_loc, k=min(len(available_in_loc), cfg.scans_per_session)))
+            # inventory_scans 有 UNIQUE(session_id, item_id)：避免重複
+            seen_item_ids: set[str] = set()
+            for idx, i in enumerate(scan_targets, start=1):
+                item_id = items.id[i]
+                if item_id in seen_item_ids:
+                    continue
+                seen_item_ids.add(item_id)
 
-        # 加一些 unexpected：從其他 location 或非 available 狀態抽
-        unexpected_pool = [it for it in items if it["status"] != "available" or it["location_id"] != location_id]
-        scan_targets.extend(rng.sample(unexpected_pool, k=min(len(unexpected_pool), max(10, cfg.scans_per_session // 10))))
+                scan_id = scan_uuid(f"{session_id}:{item_id}")
+                scanned_at = started_at + one_minute * idx
 
-        # inventory_scans 有 UNIQUE(session_id, item_id)：避免重複
-        seen_item_ids: set[str] = set()
-        for idx, it in enumerate(scan_targets, start=1):
-            if it["id"] in seen_item_ids:
-                continue
-            seen_item_ids.add(it["id"])
-
-            scan_id = uuid5(ns, f"{cfg.org_code}:inv_scan:{session_id}:{it['id']}")
-            scanned_at = started_at + dt.timedelta(minutes=idx)
-
-            inventory_scans_rows.append(
-                {
-                    "id": scan_id,
-                    "organization_id": org_id,
-                    "session_id": session_id,
-                    "location_id": location_id,
-                    "item_id": it["id"],
-                    "actor_user_id": librarian_id,
-                    "scanned_at": iso(scanned_at),
-                }
-            )
+                inventory_scan_ids.append(scan_id)
+                # 欄位：id, organization_id, session_id, location_id, item_id, actor_user_id, scanned_at
+                yield (scan_id, org_id, session_id, location_id, item_id, librarian_id, iso(scanned_at))
 
     # ----------------------------
     # 3.12 audit_events（大量）
     # - entity_id 是 text，方便記錄多型指向；這裡用既有 id 當字串即可
     # ----------------------------
-    audit_rows: list[dict[str, str]] = []
     actions = [
         ("user.import_csv", "user"),
         ("bib.create", "bib"),
@@ -2090,386 +2680,291 @@ def main() -> None:
     ]
 
     actor_pool = [admin_id, librarian_id]
-    for i in range(1, cfg.audit_events + 1):
-        event_id = uuid5(ns, f"{cfg.org_code}:audit:{i:08d}")
-        action, entity_type = rng.choice(actions)
-        actor_user_id = rng.choice(actor_pool)
-
-        # entity_id：取一些真實存在的 id（讓 UI 看起來可追溯）
-        entity_id = ""
-        if entity_type == "loan" and loans:
-            entity_id = rng.choice(loans)["id"]
-        elif entity_type == "hold" and holds:
-            entity_id = rng.choice(holds)["id"]
-        elif entity_type == "item" and items:
-            entity_id = rng.choice(items)["id"]
-        elif entity_type == "bib" and bibs:
-            entity_id = rng.choice(bibs)["id"]
-        elif entity_type == "user" and users:
-            entity_id = rng.choice(users)["id"]
-        elif entity_type == "inventory_scan" and inventory_scans_rows:
-            entity_id = rng.choice(inventory_scans_rows)["id"]
-        else:
-            entity_id = cfg.org_code
-
-        metadata = {
-            "note": "大型資料集自動產生",
-            "seed": cfg.seed,
-        }
 
-        audit_rows.append(
-            {
-                "id": event_id,
-                "organization_id": org_id,
-                "actor_user_id": actor_user_id,
-                "action": action,
-                "entity_type": entity_type,
-                "entity_id": entity_id,
-                "metadata": json.dumps(metadata, ensure_ascii=False),
-                "created_at": iso(now_utc() - dt.timedelta(days=rng.randint(0, 60))),
-            }
-        )
-
-    # ----------------------------
-    # 4) 寫 CSV（workdir）
-    # ----------------------------
-    write_csv(cfg.workdir / "organizations.csv", org_rows)
-
-    write_csv(
-        cfg.workdir / "locations.csv",
-        [
-            [
-                l["id"],
-                l["organization_id"],
-                l["code"],
-                l["name"],
-                l["area"],
-                l["shelf_code"],
-                l["status"],
-            ]
-            for l in locations
-        ],
+    audit_uuid = uuid5_numbered_series(ns, f"{cfg.org_code}:audit:", 8)
+    # metadata 每筆都一樣 → 只序列化一次，所有列共用同一個字串
+    # - 順便先做 COPY text format 的 escape（audit_events 以 escape=False 寫出；見 write_load_script）
+    audit_metadata_json = copy_text_field(
+        json.dumps({"note": "大型資料集自動產生", "seed": cfg.seed}, ensure_ascii=False)
     )
+    # created_at 只會是「今天往前 0..60 天」→ 先把 61 個 ISO 字串備好，迴圈內只剩 tuple 索引
+    audit_created_at_pool = tuple(iso_days_from_now(-d) for d in range(61))
 
-    write_csv(
-        cfg.workdir / "users.csv",
-        [
-            [
-                u["id"],
-                u["organization_id"],
-                u["external_id"],
-                u["name"],
-                u["role"],
-                u["org_unit"],
-                u["status"],
-            ]
-            for u in users
-        ],
-    )
-
-    write_csv(cfg.workdir / "user_credentials.csv", credentials_rows)
-
-    write_csv(
-        cfg.workdir / "authority_terms.csv",
-        [
-            [
-                t["id"],
-                t["organization_id"],
-                t["kind"],
-                t["vocabulary_code"],
-                t["preferred_label"],
-                t["variant_labels"],
-                t["note"],
-                t["source"],
-                t["status"],
-            ]
-            for t in authority_terms
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "authority_term_relations.csv",
-        [
-            [
-                r["id"],
-                r["organization_id"],
-                r["from_term_id"],
-                r["relation_type"],
-                r["to_term_id"],
-            ]
-            for r in authority_relations
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "bibs.csv",
-        [
-            [
-                b["id"],
-                b["organization_id"],
-                b["title"],
-                b["creators"],
-                b["contributors"],
-                b["publisher"],
-                b["published_year"],
-                b["language"],
-                b["subjects"],
-                b["geographics"],
-                b["genres"],
-                b["isbn"],
-                b["classification"],
-                b["marc_extras"],
-            ]
-            for b in bibs
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "bibliographic_subject_terms.csv",
-        [
-            [
-                r["organization_id"],
-                r["bibliographic_id"],
-                r["term_id"],
-                r["position"],
-            ]
-            for r in bib_subject_terms_rows
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "bibliographic_name_terms.csv",
-        [
-            [
-                r["organization_id"],
-                r["bibliographic_id"],
-                r["role"],
-                r["term_id"],
-                r["position"],
-            ]
-            for r in bib_name_terms_rows
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "bibliographic_geographic_terms.csv",
-        [
-            [
-                r["organization_id"],
-                r["bibliographic_id"],
-                r["term_id"],
-                r["position"],
-            ]
-            for r in bib_geographic_terms_rows
-        ],
-    )
+    def iter_audit_rows() -> Iterator[tuple[str, ...]]:
+        # 亂數整批抽（同 loans/holds）：action/actor/created_at 各一次 rng.choices(k=N)
+        n_events = cfg.audit_events
+        event_actions = rng.choices(actions, k=n_events)
+        event_actors = rng.choices(actor_pool, k=n_events)
+        event_created_days = rng.choices(range(len(audit_created_at_pool)), k=n_events)
 
-    write_csv(
-        cfg.workdir / "bibliographic_genre_terms.csv",
-        [
-            [
-                r["organization_id"],
-                r["bibliographic_id"],
-                r["term_id"],
-                r["position"],
-            ]
-            for r in bib_genre_terms_rows
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "items.csv",
-        [
-            [
-                it["id"],
-                it["organization_id"],
-                it["bibliographic_id"],
-                it["barcode"],
-                it["call_number"],
-                it["location_id"],
-                it["status"],
-                it["acquired_at"],
-                it["last_inventory_at"],
-                it["notes"],
-            ]
-            for it in items
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "policies.csv",
-        [
-            [
-                p["id"],
-                p["organization_id"],
-                p["code"],
-                p["name"],
-                p["audience_role"],
-                p["loan_days"],
-                p["max_loans"],
-                p["max_renewals"],
-                p["max_holds"],
-                p["hold_pickup_days"],
-                p["overdue_block_days"],
-                p["is_active"],
-            ]
-            for p in policies
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "loans.csv",
-        [
-            [
-                l["id"],
-                l["organization_id"],
-                l["item_id"],
-                l["user_id"],
-                l["checked_out_at"],
-                l["due_at"],
-                l["returned_at"],
-                l["renewed_count"],
-                l["status"],
-            ]
-            for l in loans
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "holds.csv",
-        [
-            [
-                h["id"],
-                h["organization_id"],
-                h["bibliographic_id"],
-                h["user_id"],
-                h["pickup_location_id"],
-                h["placed_at"],
-                h["status"],
-                h["assigned_item_id"],
-                h["ready_at"],
-                h["ready_until"],
-                h["cancelled_at"],
-                h["fulfilled_at"],
-            ]
-            for h in holds
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "inventory_sessions.csv",
-        [
-            [
-                s["id"],
-                s["organization_id"],
-                s["location_id"],
-                s["actor_user_id"],
-                s["note"],
-                s["started_at"],
-                s["closed_at"],
-            ]
-            for s in inventory_sessions_rows
-        ],
-    )
-
-    write_csv(
-        cfg.workdir / "inventory_scans.csv",
-        [
-            [
-                sc["id"],
-                sc["organization_id"],
-                sc["session_id"],
-                sc["location_id"],
-                sc["item_id"],
-                sc["actor_user_id"],
-                sc["scanned_at"],
-            ]
-            for sc in inventory_scans_rows
-        ],
-    )
+        # entity_id：取一些真實存在的 id（讓 UI 看起來可追溯）
+        # - 先數每種 entity_type 需要幾個，再從對應的 id 池一次抽好；迴圈內只要 next()
+        # - 池子是空的（或沒有對應表，例如 report）→ 用 org_code
+        # - hold_ids/inventory_scan_ids 要等 holds/scans 寫完才齊 → 必須在這個 generator 內（被消費時）才抽
+        entity_pools: dict[str, Sequence[str]] = {
+            "loan": loans.id,
+            "hold": hold_ids,
+            "item": items.id,
+            "bib": bibs.id,
+            "user": users.id,
+            "inventory_scan": inventory_scan_ids,
+        }
+        entity_counts: dict[str, int] = {}
+        for _, entity_type in event_actions:
+            entity_counts[entity_type] = entity_counts.get(entity_type, 0) + 1
+        entity_picks = {
+            entity_type: iter(rng.choices(pool, k=entity_counts[entity_type]))
+            for entity_type, pool in entity_pools.items()
+            if pool and entity_type in entity_counts
+        }
 
-    write_csv(
-        cfg.workdir / "audit_events.csv",
-        [
-            [
-                a["id"],
-                a["organization_id"],
-                a["actor_user_id"],
-                a["action"],
-                a["entity_type"],
-                a["entity_id"],
-                a["metadata"],
-                a["created_at"],
-            ]
-            for a in audit_rows
-        ],
-    )
+        for k, (action, entity_type) in enumerate(event_actions):
+            picks = entity_picks.get(entity_type)
+            entity_id = next(picks) if picks is not None else cfg.org_code
+
+            # 欄位：id, organization_id, actor_user_id, action, entity_type, entity_id, metadata, created_at
+            yield (
+                audit_uuid(k + 1),
+                org_id,
+                event_actors[k],
+                action,
+                entity_type,
+                entity_id,
+                audit_metadata_json,
+                audit_created_at_pool[event_created_days[k]],
+            )
 
     # ----------------------------
-    # 5) 產生 load.sql（psql \\copy）
+    # 4) 產生 load script（COPY ... FROM STDIN）
     # ----------------------------
-    load_sql = cfg.workdir / "load.sql"
-    # COPY CSV 的 NULL marker 我們統一用 `\N`（而不是空字串），因為：
-    # - 數字/時間欄位若用空字串，某些情境下容易被誤解成空白字串而非 NULL（尤其人眼檢查時）
-    # - `\N` 是 Postgres/psql 最常見的 NULL marker（可讀性高）
+    # 以前：每張表先寫成 workdir/*.csv，再由 load.sql 的 \\copy 讀回來 → 同一份資料在磁碟上「寫一次 + 讀一次」。
+    # 現在：把「SQL + 每張表的 COPY 資料」寫成同一份 script，直接透過 stdin 餵給 psql（不經過檔案系統）：
+    # - COPY ... FROM STDIN 的資料就接在指令後面（以單獨一行 `\.` 結束），跟 pg_dump plain 格式同一套機制
+    # - 整份 script 仍在同一個交易（BEGIN..COMMIT）內 → 任何錯誤（ON_ERROR_STOP）都會整包 rollback，不會留下半套資料
     #
-    # 注意：這裡的 `\N` 是要寫進 `load.sql` 的字面字元（反斜線 + N）
-    # - Python 一般字串的 `"\N"` 會被當成 Unicode escape，因此要用 raw string。
-    null = r"\N"
-
-    # \\copy 讀取的是「client（seed-scale 容器）」的檔案系統路徑，所以用 workdir 絕對路徑。
     # 另外：先 DELETE org 再匯入，確保「同 org_code」可重複執行而不會撞 unique constraint。
-    load_sql.write_text(
-        "\n".join(
-            [
-                "BEGIN;",
-                # RLS（Row Level Security）注意：
-                # - schema.sql 對 org-scoped tables 啟用/強制 RLS（FORCE ROW LEVEL SECURITY）
-                # - 因此：
-                #   1) 清掉舊 org 時（DELETE organizations ... ON DELETE CASCADE）必須先把 app.org_id 設成「舊 org 的 id」
-                #   2) 匯入新資料時（COPY 到 locations/users/...）必須把 app.org_id 設成「新 org 的 id」
-                #
-                # 這裡用 set_config(..., true) 讓設定只在「這個交易」內有效（BEGIN..COMMIT）。
-                f"SELECT set_config('app.org_id', COALESCE((SELECT id::text FROM organizations WHERE code = '{cfg.org_code}'), ''), true);",
-                f"DELETE FROM organizations WHERE code = '{cfg.org_code}';",
-                f"SELECT set_config('app.org_id', '{org_id}', true);",
-                "",
-                f"\\copy organizations (id, name, code) FROM '{cfg.workdir / 'organizations.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy locations (id, organization_id, code, name, area, shelf_code, status) FROM '{cfg.workdir / 'locations.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy users (id, organization_id, external_id, name, role, org_unit, status) FROM '{cfg.workdir / 'users.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy user_credentials (user_id, password_salt, password_hash, algorithm) FROM '{cfg.workdir / 'user_credentials.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy authority_terms (id, organization_id, kind, vocabulary_code, preferred_label, variant_labels, note, source, status) FROM '{cfg.workdir / 'authority_terms.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy authority_term_relations (id, organization_id, from_term_id, relation_type, to_term_id) FROM '{cfg.workdir / 'authority_term_relations.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy bibliographic_records (id, organization_id, title, creators, contributors, publisher, published_year, language, subjects, geographics, genres, isbn, classification, marc_extras) FROM '{cfg.workdir / 'bibs.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy bibliographic_subject_terms (organization_id, bibliographic_id, term_id, position) FROM '{cfg.workdir / 'bibliographic_subject_terms.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy bibliographic_name_terms (organization_id, bibliographic_id, role, term_id, position) FROM '{cfg.workdir / 'bibliographic_name_terms.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy bibliographic_geographic_terms (organization_id, bibliographic_id, term_id, position) FROM '{cfg.workdir / 'bibliographic_geographic_terms.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy bibliographic_genre_terms (organization_id, bibliographic_id, term_id, position) FROM '{cfg.workdir / 'bibliographic_genre_terms.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy item_copies (id, organization_id, bibliographic_id, barcode, call_number, location_id, status, acquired_at, last_inventory_at, notes) FROM '{cfg.workdir / 'items.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy circulation_policies (id, organization_id, code, name, audience_role, loan_days, max_loans, max_renewals, max_holds, hold_pickup_days, overdue_block_days, is_active) FROM '{cfg.workdir / 'policies.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy loans (id, organization_id, item_id, user_id, checked_out_at, due_at, returned_at, renewed_count, status) FROM '{cfg.workdir / 'loans.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy holds (id, organization_id, bibliographic_id, user_id, pickup_location_id, placed_at, status, assigned_item_id, ready_at, ready_until, cancelled_at, fulfilled_at) FROM '{cfg.workdir / 'holds.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy inventory_sessions (id, organization_id, location_id, actor_user_id, note, started_at, closed_at) FROM '{cfg.workdir / 'inventory_sessions.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy inventory_scans (id, organization_id, session_id, location_id, item_id, actor_user_id, scanned_at) FROM '{cfg.workdir / 'inventory_scans.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                f"\\copy audit_events (id, organization_id, actor_user_id, action, entity_type, entity_id, metadata, created_at) FROM '{cfg.workdir / 'audit_events.csv'}' WITH (FORMAT csv, NULL '{null}')",
-                "",
-                "COMMIT;",
-                "",
-            ]
-        ),
-        encoding="utf-8",
-    )
+    #
+    # 為什麼各表是「依序」寫，而不是丟給 process pool 平行寫？
+    # - 所有 COPY 都必須進同一個 psql session/交易（RLS 的 set_config 與整包 rollback 都靠它）→ 只有一條輸出流
+    # - holds/scans/audit 是邊寫邊抽亂數的 generator，共用同一個 rng → 換了消費順序就不再可重現
+    # - 瓶頸在 psql/Postgres 解析 COPY；Python 端產生資料時，DB 同時在吃前面已送出的資料（本來就是 pipeline）
+    def write_load_script(out: TextIO) -> None:
+        out.write(
+            "\n".join(
+                [
+                    "BEGIN;",
+                    # 這是可重跑的 seed（不是業務資料）：COMMIT 不必等 WAL flush 到磁碟
+                    # - SET LOCAL 只影響這個交易；最壞情況（DB 當機）只是最後這次 seed 要重跑
+                    "SET LOCAL synchronous_commit = off;",
+                    # RLS（Row Level Security）注意：
+                    # - schema.sql 對 org-scoped tables 啟用/強制 RLS（FORCE ROW LEVEL SECURITY）
+                    # - 因此：
+                    #   1) 清掉舊 org 時（DELETE organizations ... ON DELETE CASCADE）必須先把 app.org_id 設成「舊 org 的 id」
+                    #   2) 匯入新資料時（COPY 到 locations/users/...）必須把 app.org_id 設成「新 org 的 id」
+                    #
+                    # 這裡用 set_config(..., true) 讓設定只在「這個交易」內有效（BEGIN..COMMIT）。
+                    f"SELECT set_config('app.org_id', COALESCE((SELECT id::text FROM organizations WHERE code = '{cfg.org_code}'), ''), true);",
+                    f"DELETE FROM organizations WHERE code = '{cfg.org_code}';",
+                    f"SELECT set_config('app.org_id', '{org_id}', true);",
+                    "",
+                    "",
+                ]
+            )
+        )
+
+        # COPY 計畫：(table, columns, rows, 寫法) 依 FK 順序排好，最後一個迴圈照順序寫出
+        # - 整份 load script 的表順序/欄位/格式都集中在這張表，要換某張表的 COPY 格式只改一格
+        # - rows 可以是 list、zip 或 generator；generator（holds/scans/audit）在迴圈寫到它時才開始抽亂數
+        #   → 消費順序仍是這張表的順序（可重現性依賴它，見 3.10 的說明）
+        #
+        # loans/holds/inventory_scans/audit_events 用 write_copy_text_raw（escape=False）：
+        # - 欄位全是 UUID、ISO 時間、enum/數字常數、\N，或 org_code（ORG_CODE_RE 已限制只含 [a-z0-9-]）
+        # - audit 的 metadata 是唯一的自由文字，已在產生時先 escape 過
+        write_copy_text_raw = functools.partial(write_copy_text, escape=False)
+        copy_plan: list[tuple[str, str, Iterable[Sequence[str]], Callable[..., None]]] = [
+            ("organizations", "id, name, code", org_rows, write_copy),
+            (
+                "locations",
+                "id, organization_id, code, name, area, shelf_code, status",
+                (
+                    [l["id"], l["organization_id"], l["code"], l["name"], l["area"], l["shelf_code"], l["status"]]
+                    for l in locations
+                ),
+                write_copy,
+            ),
+            (
+                "users",
+                "id, organization_id, external_id, name, role, org_unit, status",
+                zip(
+                    users.id,
+                    itertools.repeat(org_id),
+                    users.external_id,
+                    users.name,
+                    users.role,
+                    users.org_unit,
+                    users.status,
+                ),
+                write_copy,
+            ),
+            ("user_credentials", "user_id, password_salt, password_hash, algorithm", credentials_rows, write_copy),
+            (
+                "authority_terms",
+                "id, organization_id, kind, vocabulary_code, preferred_label, variant_labels, note, source, status",
+                authority_terms,
+                write_copy,
+            ),
+            (
+                "authority_term_relations",
+                "id, organization_id, from_term_id, relation_type, to_term_id",
+                authority_relations,
+                write_copy,
+            ),
+            (
+                "bibliographic_records",
+                "id, organization_id, title, creators, contributors, publisher, published_year, language, subjects, geographics, genres, isbn, classification, marc_extras",
+                zip(
+                    bibs.id,
+                    itertools.repeat(org_id),
+                    bibs.title,
+                    bibs.creators,
+                    bibs.contributors,
+                    bibs.publisher,
+                    bibs.published_year,
+                    bibs.language,
+                    bibs.subjects,
+                    bibs.geographics,
+                    bibs.genres,
+                    bibs.isbns(),
+                    bibs.classification,
+                    bibs.marc_extras,
+                ),
+                write_copy,
+            ),
+            (
+                "bibliographic_subject_terms",
+                "organization_id, bibliographic_id, term_id, position",
+                bib_subject_terms_rows,
+                write_copy,
+            ),
+            (
+                "bibliographic_name_terms",
+                "organization_id, bibliographic_id, role, term_id, position",
+                bib_name_terms_rows,
+                write_copy,
+            ),
+            (
+                "bibliographic_geographic_terms",
+                "organization_id, bibliographic_id, term_id, position",
+                bib_geographic_terms_rows,
+                write_copy,
+            ),
+            (
+                "bibliographic_genre_terms",
+                "organization_id, bibliographic_id, term_id, position",
+                bib_genre_terms_rows,
+                write_copy,
+            ),
+            (
+                "item_copies",
+                "id, organization_id, bibliographic_id, barcode, call_number, location_id, status, acquired_at, last_inventory_at, notes",
+                zip(
+                    items.id,
+                    itertools.repeat(org_id),
+                    items.bibliographic_id,
+                    items.barcode,
+                    items.call_numbers(bibs),
+                    items.location_id,
+                    items.status,
+                    items.acquired_at,
+                    items.last_inventory_at,
+                    itertools.repeat(PG_NULL),
+                ),
+                write_copy_text,
+            ),
+            (
+                "circulation_policies",
+                "id, organization_id, code, name, audience_role, loan_days, max_loans, max_renewals, max_holds, hold_pickup_days, overdue_block_days, is_active",
+                (
+                    [
+                        p["id"],
+                        p["organization_id"],
+                        p["code"],
+                        p["name"],
+                        p["audience_role"],
+                        p["loan_days"],
+                        p["max_loans"],
+                        p["max_renewals"],
+                        p["max_holds"],
+                        p["hold_pickup_days"],
+                        p["overdue_block_days"],
+                        p["is_active"],
+                    ]
+                    for p in policies
+                ),
+                write_copy,
+            ),
+            (
+                "loans",
+                "id, organization_id, item_id, user_id, checked_out_at, due_at, returned_at, renewed_count, status",
+                zip(
+                    loans.id,
+                    itertools.repeat(org_id),
+                    loans.item_id,
+                    loans.user_id,
+                    loans.checked_out_at,
+                    loans.due_at,
+                    loans.returned_at,
+                    loans.renewed_count,
+                    loans.status,
+                ),
+                write_copy_text_raw,
+            ),
+            (
+                "holds",
+                "id, organization_id, bibliographic_id, user_id, pickup_location_id, placed_at, status, assigned_item_id, ready_at, ready_until, cancelled_at, fulfilled_at",
+                iter_hold_rows(),
+                write_copy_text_raw,
+            ),
+            (
+                "inventory_sessions",
+                "id, organization_id, location_id, actor_user_id, note, started_at, closed_at",
+                inventory_sessions_rows,
+                write_copy,
+            ),
+            (
+                "inventory_scans",
+                "id, organization_id, session_id, location_id, item_id, actor_user_id, scanned_at",
+                iter_inventory_scan_rows(),
+                write_copy_text_raw,
+            ),
+            (
+                "audit_events",
+                "id, organization_id, actor_user_id, action, entity_type, entity_id, metadata, created_at",
+                iter_audit_rows(),
+                write_copy_text_raw,
+            ),
+        ]
+
+        for table, columns, rows, write in copy_plan:
+            write(out, table, columns, rows)
+
+        out.write("\nCOMMIT;\n")
 
     # ----------------------------
-    # 6) 套用 schema + 匯入（psql）
+    # 5) 匯入（psql；與 schema 同一個 session）
     # ----------------------------
-    # schema.sql 是 idempotent（CREATE IF NOT EXISTS），先跑一次保險。
-    # - 不直接依賴 cwd，避免你在不同 working directory 執行導致找不到檔案。
-    repo_root = Path(__file__).resolve().parents[1]
-    run_psql(["-f", str(repo_root / "db/schema.sql")], cwd=repo_root)
-
-    # load.sql：真正匯入大量資料
-    run_psql(["-f", str(load_sql)], cwd=cfg.workdir)
+    if psql_stream is not None:
+        write_psql_stream(psql_stream, write_load_script)
+        finish_psql_stream(psql_stream)
+    else:
+        # 檢查模式（有設 SCALE_WORKDIR）：先把 script 落地成 workdir/load.sql（方便人工打開看），再讓 psql 讀檔
+        # - load.sql 第一行同樣是 \i schema.sql → 仍是單一 psql 行程/連線
+        assert cfg.workdir is not None
+        load_sql = cfg.workdir / "load.sql"
+        with load_sql.open("w", encoding="utf-8", newline="", buffering=COPY_WRITE_BUFFER_SIZE) as f:
+            write_schema_include(f)
+            write_load_script(f)
+        run_psql(["-f", str(load_sql)], cwd=cfg.workdir)
 
     print("")
     print("[seed-scale] ✅ 完成：大量資料已匯入。")